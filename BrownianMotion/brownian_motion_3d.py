@@ -5,11 +5,32 @@ A comprehensive 3D visualization of Brownian Motion and its connection to
 Einstein's Heat Equation, using ThreeDScene for immersive 3D rendering.
 
 Based on enriched JSON data from the KimiK2Manim pipeline.
+
+Rendering:
+    manim -pql brownian_motion_3d.py BrownianMotion3D
+    manim -pql --renderer=opengl brownian_motion_3d.py BrownianMotion3D
+
+The default Cairo renderer re-tessellates every Surface and Sphere on the
+CPU each frame. The OpenGL renderer draws them with shaders, and ambient
+camera rotation becomes a matrix update, so it is much faster for this
+scene when a GPU is available. Surface updates go through
+family_members_with_points() and work under either renderer.
+
+Performance classification:
+    Compute-bound: heat-kernel evaluation for the Gaussian surfaces. This
+    is handled by the separable grid (heat_kernel_grid), optional Numba
+    compilation, and vectorized per-frame height updates.
+    Memory/allocation-bound: everything else. The random walks, the fluid
+    molecules, and mobject construction are dominated by Python object
+    traversal and array allocation, not FLOPs. They are handled by batched
+    RNG draws, SoA position arrays, the cached axes transform, copied
+    prototype meshes, and reusing mobjects across frames.
+Speedups for the second group come from allocating and traversing less.
+JIT or GPU kernels will not help there.
 """
 
 from manim import *
 import numpy as np
-import random
 import sys
 from pathlib import Path
 
@@ -20,6 +41,160 @@ from manim_utils.frame_config import (
     DEFAULT_BODY_FONT_SIZE,
     DEFAULT_EQUATION_FONT_SIZE
 )
+from manim_utils.simulation import RANDOM_SEED
+from manim_utils.vectorized import axes_affine, corner_bezier_points
+
+# Numba is optional; without it the kernels below run as plain NumPy
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def random_walk_world_paths(steps, origin, basis):
+    """
+    Accumulate random-walk steps into paths that start at the axes origin
+    and map them to scene points.
+
+    steps has shape (num_walks, num_steps, 3); the result has shape
+    (num_walks, num_steps + 1, 3).
+    """
+    num_walks = steps.shape[0]
+    paths = np.concatenate(
+        [np.zeros((num_walks, 1, 3)), np.cumsum(steps, axis=1)],
+        axis=1
+    )
+    return origin + paths @ basis.T
+
+
+def _random_walk_world_paths_parallel(steps, origin, basis):
+    """Loop form of random_walk_world_paths, compiled with walks in parallel."""
+    num_walks, num_steps, _ = steps.shape
+    world = np.empty((num_walks, num_steps + 1, 3))
+    for w in prange(num_walks):
+        x = y = z = 0.0
+        world[w, 0] = origin
+        for k in range(num_steps):
+            x += steps[w, k, 0]
+            y += steps[w, k, 1]
+            z += steps[w, k, 2]
+            for a in range(3):
+                world[w, k + 1, a] = (
+                    origin[a] + basis[a, 0] * x + basis[a, 1] * y + basis[a, 2] * z
+                )
+    return world
+
+
+if NUMBA_AVAILABLE:
+    random_walk_world_paths = njit(cache=True, parallel=True)(
+        _random_walk_world_paths_parallel
+    )
+
+
+def heat_kernel_grid(u, v, D, t):
+    """
+    Evaluate the 2D heat kernel P(x, y, t) on the grid spanned by u and v.
+
+    The kernel is separable, P(x, y) = P(x) * P(y), so only len(u) + len(v)
+    exponentials are needed; the grid is their outer product.
+    Returns an array of shape (len(v), len(u)).
+    """
+    inv_4Dt = 1.0 / (4 * D * t)
+    gx = np.exp(-(u * u) * inv_4Dt)
+    gy = np.exp(-(v * v) * inv_4Dt)
+    return (inv_4Dt / np.pi) * np.outer(gy, gx)
+
+
+if NUMBA_AVAILABLE:
+    heat_kernel_grid = njit(cache=True, fastmath=True)(heat_kernel_grid)
+
+
+def heat_kernel_resolution(D, t_min, extent, faces_per_sigma=1.5,
+                           min_resolution=8, max_resolution=20):
+    """
+    Choose a Surface resolution that resolves the narrowest kernel shown.
+
+    The kernel width is sigma = sqrt(2 D t). Faces are sized so sigma spans
+    about faces_per_sigma of them, clamped to [min_resolution, max_resolution],
+    so wide kernels are not oversampled and sharp peaks are not undersampled.
+    """
+    sigma = np.sqrt(2 * D * t_min)
+    resolution = int(np.ceil(2 * extent * faces_per_sigma / sigma))
+    return min(max(resolution, min_resolution), max_resolution)
+
+
+def heat_kernel_surface_func(axes, D, t, extent, resolution):
+    """
+    Build a Surface sampler for the heat kernel backed by a precomputed grid.
+
+    The kernel and its scene points are tabulated once on a grid three
+    times finer than the face resolution, and each call interpolates
+    bilinearly between the four nearest grid points. Cairo's Surface
+    samples face corners and bezier handles, which land exactly on grid
+    points; OpenGL samples a coarser grid, which falls between them.
+    """
+    samples = 3 * resolution + 1
+    coords = np.linspace(-extent, extent, samples)
+    heights = heat_kernel_grid(coords, coords, D, t)
+    u_grid, v_grid = np.meshgrid(coords, coords)
+    origin, basis = axes_affine(axes)
+    grid_points = origin + np.stack([u_grid, v_grid, heights], axis=-1) @ basis.T
+    scale = (samples - 1) / (2 * extent)
+    
+    def func(u, v):
+        x = min(max((u + extent) * scale, 0.0), samples - 1.0)
+        y = min(max((v + extent) * scale, 0.0), samples - 1.0)
+        i = min(int(x), samples - 2)
+        j = min(int(y), samples - 2)
+        fx, fy = x - i, y - j
+        lower = (1 - fx) * grid_points[j, i] + fx * grid_points[j, i + 1]
+        upper = (1 - fx) * grid_points[j + 1, i] + fx * grid_points[j + 1, i + 1]
+        return (1 - fy) * lower + fy * upper
+    
+    return func
+
+
+def heat_kernel_updater(surface, axes, D, t_start, t_end, log_time=False,
+                        colors=None):
+    """
+    Build an UpdateFromAlphaFunc callback that reshapes a heat-kernel surface
+    in place as t runs from t_start to t_end.
+
+    The surface points are mapped back to axes coordinates once; each frame
+    only recomputes the heights and writes them into the existing point
+    arrays instead of building a new Surface to transform into. Surfaces
+    are sampled on a tensor grid, so the points share a few distinct x and
+    y values and the heights come from heat_kernel_grid over those.
+    With log_time, t is interpolated geometrically so each doubling of t
+    takes equal time. If colors are given, the surface is recolored along
+    their gradient as t advances.
+    """
+    parts = surface.family_members_with_points()
+    points = np.concatenate([part.points for part in parts])
+    origin, basis = axes_affine(axes)
+    coords = np.linalg.solve(basis, (points - origin).T).T
+    xs, x_index = np.unique(coords[:, 0].round(9), return_inverse=True)
+    ys, y_index = np.unique(coords[:, 1].round(9), return_inverse=True)
+    out = basis[:, 2]
+    base = points - np.outer(coords[:, 2], out)
+    splits = np.cumsum([len(part.points) for part in parts])[:-1]
+    palette = color_gradient(colors, 64) if colors else None
+    
+    def update(mob, alpha):
+        if log_time:
+            t = t_start * (t_end / t_start) ** alpha
+        else:
+            t = interpolate(t_start, t_end, alpha)
+        heights = heat_kernel_grid(xs, ys, D, t)[y_index, x_index]
+        new_points = base + np.outer(heights, out)
+        for part, part_points in zip(parts, np.split(new_points, splits)):
+            part.points = part_points
+        if palette:
+            color = palette[round(alpha * (len(palette) - 1))]
+            mob.set_fill(color).set_stroke(color)
+    
+    return update
 
 
 class BrownianMotion3D(ThreeDScene):
@@ -36,10 +211,59 @@ class BrownianMotion3D(ThreeDScene):
     [110-120s] Conclusion
     """
     
+    # Diffusion coefficient shared by the Gaussian sections
+    diffusion_coefficient = 0.5
+    
+    def setup(self):
+        """Compile every section's LaTeX before the first animation."""
+        super().setup()
+        self.walk_mean_eq = MathTex(
+            r"\langle x(t) \rangle = 0",
+            font_size=36,
+            color=GOLD
+        )
+        self.msd_eq = MathTex(
+            r"\langle x^2(t) \rangle = 2Dt",
+            font_size=36,
+            color=GREEN
+        )
+        self.diffusion_eq = MathTex(
+            r"\frac{\partial P}{\partial t} = D \nabla^2 P",
+            font_size=42,
+            color=GOLD
+        )
+        self.solution_eq = MathTex(
+            r"P(x,t) = \frac{1}{\sqrt{4\pi D t}} \exp\left[-\frac{x^2}{4Dt}\right]",
+            font_size=36,
+            color=BLUE
+        )
+        self.einstein_eq = MathTex(
+            r"D = \frac{k_B T}{6\pi\eta a}",
+            font_size=42,
+            color=GOLD
+        )
+        self.heat_eq = MathTex(
+            r"\frac{\partial u}{\partial t} = \alpha \nabla^2 u",
+            font_size=36,
+            color=RED
+        )
+    
     def construct(self):
         # Set background
         self.camera.background_color = "#001122"
         
+        # Single random generator shared by every section
+        self.rng = np.random.default_rng(RANDOM_SEED)
+        
+        # Axes shared by the probability and diffusion sections, which run
+        # back to back and stay on screen between them
+        self.kernel_axes = ThreeDAxes(
+            x_range=[-3, 3, 1],
+            y_range=[-3, 3, 1],
+            z_range=[0, 1.5, 0.3],
+            axis_config={"color": WHITE, "stroke_width": 2}
+        )
+        
         # Set initial camera orientation
         self.set_camera_orientation(phi=75 * DEGREES, theta=45 * DEGREES)
         
@@ -113,39 +337,36 @@ class BrownianMotion3D(ThreeDScene):
         trajectories = VGroup()
         particles = VGroup()
         colors = [RED, YELLOW, GREEN, BLUE, PURPLE, ORANGE, PINK, TEAL]
+        num_steps = 100
+        
+        # Generate all random walk paths at once: each path starts at the
+        # origin and accumulates uniform 3D steps
+        steps = self.rng.uniform(-0.15, 0.15, size=(num_walks, num_steps, 3))
+        origin, basis = axes_affine(axes)
+        world_paths = random_walk_world_paths(steps, origin, basis)
+        # One buffer holds the bezier points of every trajectory
+        trajectory_points = corner_bezier_points(world_paths)
+        
+        # Tessellate the particle sphere once; copies only duplicate points
+        particle_template = Sphere(radius=0.15, fill_opacity=0.9)
         
         for i in range(num_walks):
-            # Generate random walk path
-            path = [ORIGIN]
-            current_pos = np.array([0.0, 0.0, 0.0])
-            
-            for _ in range(100):
-                # Random step in 3D
-                step = np.array([
-                    random.uniform(-0.15, 0.15),
-                    random.uniform(-0.15, 0.15),
-                    random.uniform(-0.15, 0.15)
-                ])
-                current_pos += step
-                path.append(current_pos.copy())
+            path = world_paths[i]
             
             # Create trajectory line
             trajectory = VMobject()
-            trajectory.set_points_as_corners([axes.c2p(*p) for p in path])
+            trajectory.points = trajectory_points[i]
             trajectory.set_stroke(color=colors[i % len(colors)], width=3, opacity=0.8)
             trajectories.add(trajectory)
             
             # Create particle at end
-            particle = Sphere(
-                radius=0.15,
-                color=colors[i % len(colors)],
-                fill_opacity=0.9
-            ).move_to(axes.c2p(*path[-1]))
+            particle = particle_template.copy()
+            particle.set_color(colors[i % len(colors)]).move_to(path[-1])
             particles.add(particle)
         
         # Animate trajectories
-        self.play(*[Create(traj) for traj in trajectories], run_time=5)
-        self.play(*[FadeIn(particle) for particle in particles], run_time=2)
+        self.play(Create(trajectories), run_time=5)
+        self.play(FadeIn(particles), run_time=2)
         
         # Rotate camera to show 3D nature
         self.begin_ambient_camera_rotation(rate=0.1)
@@ -153,11 +374,7 @@ class BrownianMotion3D(ThreeDScene):
         self.stop_ambient_camera_rotation()
         
         # Show equation
-        eq = MathTex(
-            r"\langle x(t) \rangle = 0",
-            font_size=36,
-            color=GOLD
-        ).to_edge(DOWN, buff=0.5)
+        eq = self.walk_mean_eq.to_edge(DOWN, buff=0.5)
         
         self.play(Write(eq), run_time=2)
         self.wait(2)
@@ -183,66 +400,57 @@ class BrownianMotion3D(ThreeDScene):
         
         self.play(Write(title), run_time=1)
         
-        # Create 3D axes for probability visualization
-        axes = ThreeDAxes(
-            x_range=[-4, 4, 1],
-            y_range=[-4, 4, 1],
-            z_range=[0, 2, 0.5],
-            axis_config={"color": WHITE, "stroke_width": 2}
-        )
-        
+        # 3D axes for probability visualization
+        axes = self.kernel_axes
         self.play(Create(axes), run_time=1)
         
         # Animate Gaussian spreading over time
-        D = 0.5  # Diffusion coefficient
-        times = [0.5, 1.0, 2.0, 4.0]
+        D = self.diffusion_coefficient
+        t_start, t_end = 0.5, 4.0
         colors_gaussian = [RED, YELLOW, GREEN, BLUE]
-        gaussians = VGroup()
-        
-        for t, color in zip(times, colors_gaussian):
-            # Create 3D Gaussian surface
-            def gaussian_func(x, y):
-                return (1 / (4 * np.pi * D * t)) * np.exp(-(x**2 + y**2) / (4 * D * t))
-            
-            surface = Surface(
-                lambda u, v: axes.c2p(
-                    u,
-                    v,
-                    gaussian_func(u, v)
-                ),
-                u_range=[-3, 3],
-                v_range=[-3, 3],
-                resolution=(20, 20),
-                fill_opacity=0.7,
-                fill_color=color,
-                stroke_width=1,
-                stroke_color=color
-            )
-            gaussians.add(surface)
+        extent = 3
+        resolution = heat_kernel_resolution(D, t_start, extent)
+        
+        # Create 3D Gaussian surface
+        surface = Surface(
+            heat_kernel_surface_func(axes, D, t_start, extent, resolution),
+            u_range=[-extent, extent],
+            v_range=[-extent, extent],
+            resolution=(resolution, resolution),
+            fill_opacity=0.7,
+            fill_color=colors_gaussian[0],
+            stroke_width=1,
+            stroke_color=colors_gaussian[0]
+        )
         
-        # Animate Gaussian spreading
-        self.play(Create(gaussians[0]), run_time=2)
+        # Animate Gaussian spreading: t doubles every 2 seconds while the
+        # surface is reshaped and recolored in place
+        self.play(Create(surface), run_time=2)
         self.begin_ambient_camera_rotation(rate=0.15)
-        self.play(Transform(gaussians[0], gaussians[1]), run_time=2)
-        self.play(Transform(gaussians[1], gaussians[2]), run_time=2)
-        self.play(Transform(gaussians[2], gaussians[3]), run_time=2)
+        self.play(
+            UpdateFromAlphaFunc(
+                surface,
+                heat_kernel_updater(
+                    surface, axes, D, t_start, t_end,
+                    log_time=True,
+                    colors=colors_gaussian
+                )
+            ),
+            run_time=6,
+            rate_func=linear
+        )
         self.stop_ambient_camera_rotation()
         self.wait(2)
         
         # Show MSD equation
-        msd_eq = MathTex(
-            r"\langle x^2(t) \rangle = 2Dt",
-            font_size=36,
-            color=GREEN
-        ).to_edge(DOWN, buff=0.5)
+        msd_eq = self.msd_eq.to_edge(DOWN, buff=0.5)
         
         self.play(Write(msd_eq), run_time=2)
         self.wait(2)
         
-        # Transition
+        # Transition (axes stay for the diffusion section)
         self.play(
-            FadeOut(axes),
-            FadeOut(gaussians),
+            FadeOut(surface),
             FadeOut(title),
             FadeOut(msd_eq),
             run_time=2
@@ -260,57 +468,50 @@ class BrownianMotion3D(ThreeDScene):
         self.play(Write(title), run_time=1)
         
         # Show diffusion equation
-        diffusion_eq = MathTex(
-            r"\frac{\partial P}{\partial t} = D \nabla^2 P",
-            font_size=42,
-            color=GOLD
-        ).shift(UP * 1)
+        diffusion_eq = self.diffusion_eq.shift(UP * 1)
         
         self.play(Write(diffusion_eq), run_time=2)
         
-        # Create 3D visualization of diffusion
-        axes = ThreeDAxes(
-            x_range=[-3, 3, 1],
-            y_range=[-3, 3, 1],
-            z_range=[0, 1.5, 0.3],
-            axis_config={"color": WHITE, "stroke_width": 2}
-        )
+        # 3D visualization of diffusion, on the axes already on screen
+        axes = self.kernel_axes
         
         # Animate diffusion process
-        D = 0.5
-        t_vals = np.linspace(0.1, 3.0, 30)
+        D = self.diffusion_coefficient
+        t_start, t_end = 0.1, 3.0
+        extent = 3
+        # The mesh is reused for every t, so size it for the sharpest peak
+        resolution = heat_kernel_resolution(D, t_start, extent)
         
         def create_diffusion_surface(t):
-            def func(x, y):
-                return (1 / (4 * np.pi * D * t)) * np.exp(-(x**2 + y**2) / (4 * D * t))
             return Surface(
-                lambda u, v: axes.c2p(u, v, func(u, v)),
-                u_range=[-3, 3],
-                v_range=[-3, 3],
-                resolution=(15, 15),
+                heat_kernel_surface_func(axes, D, t, extent, resolution),
+                u_range=[-extent, extent],
+                v_range=[-extent, extent],
+                resolution=(resolution, resolution),
                 fill_opacity=0.6,
                 fill_color=BLUE,
                 stroke_width=1,
                 stroke_color=BLUE
             )
         
-        surface = create_diffusion_surface(t_vals[0])
-        self.play(Create(axes), Create(surface), run_time=2)
+        surface = create_diffusion_surface(t_start)
+        self.play(Create(surface), run_time=2)
         
-        # Animate spreading
+        # Animate spreading by updating the surface heights in place
         self.begin_ambient_camera_rotation(rate=0.1)
-        for i in range(1, len(t_vals), 3):
-            new_surface = create_diffusion_surface(t_vals[i])
-            self.play(Transform(surface, new_surface), run_time=0.5)
+        self.play(
+            UpdateFromAlphaFunc(
+                surface,
+                heat_kernel_updater(surface, axes, D, t_start, t_end)
+            ),
+            run_time=5,
+            rate_func=linear
+        )
         self.stop_ambient_camera_rotation()
         self.wait(2)
         
         # Show solution equation
-        solution_eq = MathTex(
-            r"P(x,t) = \frac{1}{\sqrt{4\pi D t}} \exp\left[-\frac{x^2}{4Dt}\right]",
-            font_size=36,
-            color=BLUE
-        ).to_edge(DOWN, buff=0.5)
+        solution_eq = self.solution_eq.to_edge(DOWN, buff=0.5)
         
         self.play(Write(solution_eq), run_time=2)
         self.wait(2)
@@ -337,29 +538,20 @@ class BrownianMotion3D(ThreeDScene):
         self.play(Write(title), run_time=1)
         
         # Show Einstein's relation
-        einstein_eq = MathTex(
-            r"D = \frac{k_B T}{6\pi\eta a}",
-            font_size=42,
-            color=GOLD
-        ).shift(UP * 0.5)
+        einstein_eq = self.einstein_eq.shift(UP * 0.5)
         
         self.play(Write(einstein_eq), run_time=2)
         
         # Create 3D visualization: particle in fluid
-        # Create fluid molecules (small spheres)
-        fluid_molecules = VGroup()
+        # Create fluid molecules (low-resolution Dot3D spheres; at this
+        # radius the default Sphere mesh is wasted detail)
         num_molecules = 50
-        
-        for _ in range(num_molecules):
-            x = random.uniform(-2, 2)
-            y = random.uniform(-2, 2)
-            z = random.uniform(-2, 2)
-            molecule = Sphere(
-                radius=0.1,
-                color=BLUE,
-                fill_opacity=0.6
-            ).move_to([x, y, z])
-            fluid_molecules.add(molecule)
+        positions = self.rng.uniform(-2, 2, size=(num_molecules, 3))
+        molecule_template = Dot3D(radius=0.1, color=BLUE, fill_opacity=0.6)
+        fluid_molecules = VGroup(*[
+            molecule_template.copy().move_to(position)
+            for position in positions
+        ])
         
         # Create Brownian particle (larger sphere)
         brownian_particle = Sphere(
@@ -373,18 +565,15 @@ class BrownianMotion3D(ThreeDScene):
         # Animate molecular collisions
         self.begin_ambient_camera_rotation(rate=0.1)
         
+        # Molecule centers live in one array so each frame takes a single
+        # batched random step
         def update_molecules(mobj, dt):
-            for molecule in mobj:
-                # Random motion
-                shift = np.array([
-                    random.uniform(-0.05, 0.05),
-                    random.uniform(-0.05, 0.05),
-                    random.uniform(-0.05, 0.05)
-                ])
-                new_pos = molecule.get_center() + shift
-                # Keep within bounds
-                new_pos = np.clip(new_pos, -2.5, 2.5)
-                molecule.move_to(new_pos)
+            # Random motion, kept within bounds
+            new_positions = positions + self.rng.uniform(-0.05, 0.05, size=positions.shape)
+            np.clip(new_positions, -2.5, 2.5, out=new_positions)
+            for molecule, delta in zip(mobj, new_positions - positions):
+                molecule.shift(delta)
+            positions[:] = new_positions
         
         fluid_molecules.add_updater(update_molecules)
         self.add(fluid_molecules)
@@ -393,11 +582,7 @@ class BrownianMotion3D(ThreeDScene):
         self.stop_ambient_camera_rotation()
         
         # Show connection to heat equation
-        heat_eq = MathTex(
-            r"\frac{\partial u}{\partial t} = \alpha \nabla^2 u",
-            font_size=36,
-            color=RED
-        ).to_edge(DOWN, buff=0.5)
+        heat_eq = self.heat_eq.to_edge(DOWN, buff=0.5)
         
         self.play(Write(heat_eq), run_time=2)
         self.wait(2)
@@ -7,13 +7,22 @@ all content stays within frame boundaries.
 
 from manim import *
 import numpy as np
-import random
 import sys
 from pathlib import Path
 
 # Add parent directory to path to import bounded_scene
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from manim_utils.bounded_scene import BoundedScene, SAFE_WIDTH, SAFE_HEIGHT
+from manim_utils.bounded_scene import (
+    BoundedScene,
+    SAFE_WIDTH,
+    SAFE_HEIGHT,
+    SAFE_X_MIN,
+    SAFE_X_MAX,
+    SAFE_Y_MIN,
+    SAFE_Y_MAX
+)
+from manim_utils.simulation import RANDOM_SEED, brownian_particle_stepper, wait_fixed_steps
+from manim_utils.vectorized import coords_to_points, corner_bezier_points
 from manim_utils.frame_config import (
     DEFAULT_TITLE_FONT_SIZE,
     DEFAULT_SUBTITLE_FONT_SIZE,
@@ -28,10 +37,32 @@ class BrownianMotionBounded(BoundedScene):
     All content is automatically constrained within frame boundaries.
     """
     
+    # Every equation built with bounded_math_tex, compiled in parallel by
+    # BoundedScene.setup(); kwargs must match the call sites to hit the cache
+    precompiled_math_tex = [
+        (r"\langle x^2(t) \rangle = 2Dt",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE, color=GREEN)),
+        (r"\frac{\partial P}{\partial t} = D \nabla^2 P",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE, color=WHITE)),
+        (r"P(x,t|x_0,0) = \frac{1}{\sqrt{4\pi D t}} \exp\left[-\frac{(x-x_0)^2}{4Dt}\right]",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE - 4, color=WHITE)),
+        (r"D = \frac{k_B T}{6\pi \eta a}",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE, color=WHITE)),
+        (r"k_B: \text{Boltzmann constant}", dict(font_size=DEFAULT_BODY_FONT_SIZE, color=BLUE)),
+        (r"T: \text{temperature}", dict(font_size=DEFAULT_BODY_FONT_SIZE, color=BLUE)),
+        (r"\eta: \text{viscosity}", dict(font_size=DEFAULT_BODY_FONT_SIZE, color=BLUE)),
+        (r"a: \text{particle radius}", dict(font_size=DEFAULT_BODY_FONT_SIZE, color=BLUE)),
+        (r"\frac{\partial u}{\partial t} = \alpha \nabla^2 u",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE - 2, color=WHITE)),
+    ]
+    
     def construct(self):
         # Set background
         self.camera.background_color = "#001122"
         
+        # Single random generator shared by every section
+        self.rng = np.random.default_rng(RANDOM_SEED)
+        
         # Timeline breakdown for 120 seconds:
         self.intro_sequence()  # 0-15s
         self.microscopic_brownian_motion()  # 15-45s
@@ -76,43 +107,45 @@ class BrownianMotionBounded(BoundedScene):
         self.wait(2)
         
         # Transition
-        self.play(
-            FadeOut(title),
-            FadeOut(subtitle),
-            FadeOut(context),
-            run_time=2
-        )
+        self.play(FadeOut(VGroup(title, subtitle, context)), run_time=2)
         self.wait(1)
     
     def microscopic_brownian_motion(self):
         """[15-45s] Show microscopic view - constrained to safe area."""
+        water_lo = np.array([SAFE_X_MIN, SAFE_Y_MIN])
+        water_hi = np.array([SAFE_X_MAX, SAFE_Y_MAX])
+        pollen_lo = water_lo + 0.5
+        pollen_hi = water_hi - 0.5
+        
         # Create water molecules within safe boundaries
-        water_molecules = VGroup()
         num_molecules = 200
-        for _ in range(num_molecules):
-            x = random.uniform(SAFE_X_MIN, SAFE_X_MAX)
-            y = random.uniform(SAFE_Y_MIN, SAFE_Y_MAX)
-            molecule = Dot(
-                point=[x, y, 0],
-                radius=0.05,
-                color=BLUE,
-                fill_opacity=0.6
-            )
-            water_molecules.add(molecule)
+        water_pos = self.rng.uniform(water_lo, water_hi, (num_molecules, 2))
+        # Build one styled molecule and copy it; copying skips the
+        # per-instance style derivation of a fresh Dot
+        molecule_template = Dot(radius=0.05, color=BLUE, fill_opacity=0.6)
+        water_molecules = VGroup(*[
+            molecule_template.copy().move_to([x, y, 0])
+            for x, y in water_pos
+        ])
         
         # Create pollen grains within safe boundaries
-        pollen_grains = VGroup()
         num_pollen = 5
-        for i in range(num_pollen):
-            x = random.uniform(SAFE_X_MIN + 1, SAFE_X_MAX - 1)
-            y = random.uniform(SAFE_Y_MIN + 0.5, SAFE_Y_MAX - 0.5)
-            pollen = Circle(
-                radius=0.3,
-                color=GOLD,
-                fill_opacity=0.8,
-                stroke_width=2
-            ).move_to([x, y, 0])
-            pollen_grains.add(pollen)
+        pollen_pos = self.rng.uniform(
+            water_lo + [1, 0.5], water_hi - [1, 0.5], (num_pollen, 2)
+        )
+        # Four quarter-arc curves are indistinguishable from the default
+        # eight at this radius and halve the points every copy and move touches
+        pollen_template = Dot(
+            radius=0.3,
+            color=GOLD,
+            fill_opacity=0.8,
+            stroke_width=2,
+            num_components=5
+        )
+        pollen_grains = VGroup(*[
+            pollen_template.copy().move_to([x, y, 0])
+            for x, y in pollen_pos
+        ])
         
         # Label - bounded
         label = self.bounded_text(
@@ -123,69 +156,41 @@ class BrownianMotionBounded(BoundedScene):
         self.safe_position(label, position='top')
         
         self.play(FadeIn(label), run_time=1)
-        self.play(
-            *[FadeIn(mol) for mol in water_molecules],
-            run_time=2
-        )
-        self.play(
-            *[FadeIn(pollen) for pollen in pollen_grains],
-            run_time=1.5
-        )
+        self.play(FadeIn(water_molecules), run_time=2)
+        self.play(FadeIn(pollen_grains), run_time=1.5)
         self.wait(1)
         
         # Animate Brownian motion - keep within bounds
-        pollen_trajectories = VGroup()
-        pollen_colors = [RED, GREEN, YELLOW, PURPLE, ORANGE]
-        
-        for i, pollen in enumerate(pollen_grains):
-            trail = TracedPath(
-                pollen.get_center,
-                stroke_color=pollen_colors[i % len(pollen_colors)],
-                stroke_width=3,
-                stroke_opacity=0.7
-            )
-            pollen_trajectories.add(trail)
+        # A single updater advances every particle on a fixed 0.1s step, so
+        # the scene schedules one wait instead of twenty
+        step_time, num_steps = 0.1, 20
+        
+        # Every step is drawn up front; each tick only indexes a view
+        water_steps = self.rng.uniform(-0.3, 0.3, (num_steps, num_molecules, 2))
+        pollen_steps = self.rng.uniform(-0.2, 0.2, (num_steps, num_pollen, 2))
         
+        advance_particles, pollen_trajectories = brownian_particle_stepper(
+            water_molecules, water_pos, water_steps, (water_lo, water_hi),
+            pollen_grains, pollen_pos, pollen_steps, (pollen_lo, pollen_hi)
+        )
         self.add(pollen_trajectories)
         
-        # Animate motion with boundary checking
-        for frame in range(20):
-            for mol in water_molecules:
-                dx = random.uniform(-0.3, 0.3)
-                dy = random.uniform(-0.3, 0.3)
-                new_pos = mol.get_center() + np.array([dx, dy, 0])
-                new_pos[0] = np.clip(new_pos[0], SAFE_X_MIN, SAFE_X_MAX)
-                new_pos[1] = np.clip(new_pos[1], SAFE_Y_MIN, SAFE_Y_MAX)
-                mol.move_to(new_pos)
-            
-            for i, pollen in enumerate(pollen_grains):
-                dx = random.uniform(-0.2, 0.2)
-                dy = random.uniform(-0.2, 0.2)
-                new_pos = pollen.get_center() + np.array([dx, dy, 0])
-                new_pos[0] = np.clip(new_pos[0], SAFE_X_MIN + 0.5, SAFE_X_MAX - 0.5)
-                new_pos[1] = np.clip(new_pos[1], SAFE_Y_MIN + 0.5, SAFE_Y_MAX - 0.5)
-                pollen.move_to(new_pos)
-            
-            self.wait(0.1)
+        wait_fixed_steps(self, water_molecules, advance_particles, step_time, num_steps)
         
         self.wait(2)
         
-        # Store for later
-        self.water_molecules = water_molecules
-        self.pollen_grains = pollen_grains
-        self.pollen_trajectories = pollen_trajectories
-        self.label = label
+        # Everything shown in this section, faded out together by the next
+        self.section_content = VGroup(
+            water_molecules,
+            pollen_grains,
+            pollen_trajectories,
+            label
+        )
     
     def random_walk_analysis(self):
         """[45-70s] Random walk analysis - bounded axes and equations."""
         # Transition
-        self.play(
-            FadeOut(self.water_molecules),
-            FadeOut(self.pollen_grains),
-            FadeOut(self.pollen_trajectories),
-            FadeOut(self.label),
-            run_time=2
-        )
+        self.play(FadeOut(self.section_content), run_time=2)
         
         # Title - bounded
         title = self.bounded_text(
@@ -214,21 +219,20 @@ class BrownianMotionBounded(BoundedScene):
         
         # Simulate random walk trajectory
         num_steps = 50
-        positions = [0]
-        times = list(range(num_steps + 1))
+        steps = self.rng.uniform(-0.3, 0.3, num_steps)
         
-        for i in range(num_steps):
-            step = random.uniform(-0.3, 0.3)
-            positions.append(positions[-1] + step)
+        # (t, position) pairs are filled in place: the walk accumulates
+        # straight into the position column, starting from 0 at t = 0
+        walk_coords = np.zeros((num_steps + 1, 2))
+        walk_coords[:, 0] = np.arange(num_steps + 1)
+        np.cumsum(steps, out=walk_coords[1:, 1])
         
         # Plot trajectory
-        trajectory_points = [
-            axes.coords_to_point(t, pos)
-            for t, pos in zip(times, positions)
-        ]
+        # One affine transform converts every (t, position) pair
+        trajectory_points = coords_to_points(axes, walk_coords)
         
         trajectory = VMobject()
-        trajectory.set_points_as_corners(trajectory_points)
+        trajectory.points = corner_bezier_points(trajectory_points)
         trajectory.set_stroke(color=YELLOW, width=3)
         
         self.play(Create(trajectory), run_time=3)
@@ -265,13 +269,11 @@ class BrownianMotionBounded(BoundedScene):
         
         # Plot MSD = 2Dt
         D = 0.1
-        msd_points = [
-            msd_axes.coords_to_point(t, 2 * D * t)
-            for t in np.linspace(0, 10, 50)
-        ]
+        msd_t = np.linspace(0, 10, 50)
+        msd_points = coords_to_points(msd_axes, np.column_stack([msd_t, 2 * D * msd_t]))
         
         msd_curve = VMobject()
-        msd_curve.set_points_as_corners(msd_points)
+        msd_curve.points = corner_bezier_points(msd_points)
         msd_curve.set_stroke(color=GREEN, width=4)
         
         self.play(Create(msd_curve), run_time=2)
@@ -288,26 +290,20 @@ class BrownianMotionBounded(BoundedScene):
         self.play(Write(msd_eq), run_time=1.5)
         self.wait(2)
         
-        # Store
-        self.title_rw = title
-        self.axes = axes
-        self.trajectory = trajectory
-        self.msd_axes = msd_axes
-        self.msd_curve = msd_curve
-        self.msd_eq = msd_eq
+        # Everything shown in this section, faded out together by the next
+        self.section_content = VGroup(
+            title,
+            axes,
+            trajectory,
+            msd_axes,
+            msd_curve,
+            msd_eq
+        )
     
     def diffusion_equation(self):
         """[70-95s] Diffusion equation - bounded."""
         # Transition
-        self.play(
-            FadeOut(self.title_rw),
-            FadeOut(self.axes),
-            FadeOut(self.trajectory),
-            FadeOut(self.msd_axes),
-            FadeOut(self.msd_curve),
-            FadeOut(self.msd_eq),
-            run_time=2
-        )
+        self.play(FadeOut(self.section_content), run_time=2)
         
         # Title - bounded
         title = self.bounded_text(
@@ -337,7 +333,7 @@ class BrownianMotionBounded(BoundedScene):
         ).arrange(DOWN, buff=0.3).next_to(diffusion_eq, DOWN, buff=0.8)
         self.constrain_to_safe_area(explanation)
         
-        self.play(*[FadeIn(exp) for exp in explanation], run_time=2)
+        self.play(FadeIn(explanation), run_time=2)
         
         # Solution - bounded
         solution_title = self.bounded_text(
@@ -373,47 +369,41 @@ class BrownianMotionBounded(BoundedScene):
         
         # Animate Gaussian spreading
         gaussians = VGroup()
-        times = [0.5, 1.0, 2.0, 4.0]
+        times = np.array([0.5, 1.0, 2.0, 4.0])
         colors = [RED, YELLOW, GREEN, BLUE]
         D = 0.5
-        
-        for t, color in zip(times, colors):
-            x_vals = np.linspace(-3, 3, 100)
-            y_vals = (1 / np.sqrt(4 * np.pi * D * t)) * np.exp(-(x_vals**2) / (4 * D * t))
-            points = [
-                gaussian_axes.coords_to_point(x, y)
-                for x, y in zip(x_vals, y_vals)
-            ]
+
+        # Evaluate every time slice in one broadcast: rows are times, columns x
+        t = times[:, None]
+        x_vals = np.linspace(-3, 3, 100)[None, :]
+        y_vals = np.exp(-(x_vals**2) / (4 * D * t)) / np.sqrt(4 * np.pi * D * t)
+        coords = np.stack(np.broadcast_arrays(x_vals, y_vals), axis=-1)
+        curve_points = corner_bezier_points(coords_to_points(gaussian_axes, coords))
+
+        for points, color in zip(curve_points, colors):
             curve = VMobject()
-            curve.set_points_as_corners(points)
+            curve.points = points
             curve.set_stroke(color=color, width=3)
             gaussians.add(curve)
         
-        self.play(*[Create(g) for g in gaussians], run_time=3)
+        self.play(Create(gaussians, lag_ratio=0.3), run_time=3)
         self.wait(2)
         
-        # Store
-        self.title_diff = title
-        self.diffusion_eq = diffusion_eq
-        self.explanation = explanation
-        self.solution_title = solution_title
-        self.solution_eq = solution_eq
-        self.gaussian_axes = gaussian_axes
-        self.gaussians = gaussians
+        # Everything shown in this section, faded out together by the next
+        self.section_content = VGroup(
+            title,
+            diffusion_eq,
+            explanation,
+            solution_title,
+            solution_eq,
+            gaussian_axes,
+            gaussians
+        )
     
     def einstein_relation(self):
         """[95-115s] Einstein's relation - bounded."""
         # Transition
-        self.play(
-            FadeOut(self.title_diff),
-            FadeOut(self.diffusion_eq),
-            FadeOut(self.explanation),
-            FadeOut(self.solution_title),
-            FadeOut(self.solution_eq),
-            FadeOut(self.gaussian_axes),
-            FadeOut(self.gaussians),
-            run_time=2
-        )
+        self.play(FadeOut(self.section_content), run_time=2)
         
         # Title - bounded
         title = self.bounded_text(
@@ -444,7 +434,7 @@ class BrownianMotionBounded(BoundedScene):
         ).arrange(DOWN, buff=0.3).next_to(einstein_eq, DOWN, buff=0.8)
         self.constrain_to_safe_area(definitions)
         
-        self.play(*[FadeIn(defn) for defn in definitions], run_time=2)
+        self.play(FadeIn(definitions), run_time=2)
         
         # Connection - bounded
         connection_title = self.bounded_text(
@@ -478,26 +468,20 @@ class BrownianMotionBounded(BoundedScene):
         self.play(Write(connection_text), run_time=2)
         self.wait(2)
         
-        # Store
-        self.title_einstein = title
-        self.einstein_eq = einstein_eq
-        self.definitions = definitions
-        self.connection_title = connection_title
-        self.heat_eq = heat_eq
-        self.connection_text = connection_text
+        # Everything shown in this section, faded out together by the next
+        self.section_content = VGroup(
+            title,
+            einstein_eq,
+            definitions,
+            connection_title,
+            heat_eq,
+            connection_text
+        )
     
     def conclusion(self):
         """[115-120s] Conclusion - bounded."""
         # Transition
-        self.play(
-            FadeOut(self.title_einstein),
-            FadeOut(self.einstein_eq),
-            FadeOut(self.definitions),
-            FadeOut(self.connection_title),
-            FadeOut(self.heat_eq),
-            FadeOut(self.connection_text),
-            run_time=2
-        )
+        self.play(FadeOut(self.section_content), run_time=2)
         
         # Final message - bounded
         conclusion = self.bounded_text(
@@ -7,12 +7,14 @@ and automatically manage content lifecycle.
 
 from manim import *
 import numpy as np
-import random
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from manim_utils.managed_scene import ManagedBoundedScene
+from manim_utils.simulation import RANDOM_SEED, brownian_particle_stepper, wait_fixed_steps
+from manim_utils.frame_config import DEFAULT_EQUATION_FONT_SIZE
+from manim_utils.vectorized import coords_to_points, corner_bezier_points
 
 
 class BrownianMotionManaged(ManagedBoundedScene):
@@ -21,9 +23,27 @@ class BrownianMotionManaged(ManagedBoundedScene):
     Text and equations are automatically managed to prevent overlaps.
     """
     
+    # Every equation added with add_equation, compiled in parallel by
+    # BoundedScene.setup(); add_equation defaults to the equation font size
+    precompiled_math_tex = [
+        (r"\langle x^2(t) \rangle = 2Dt",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE, color=GREEN)),
+        (r"\frac{\partial P}{\partial t} = D \nabla^2 P",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE, color=WHITE)),
+        (r"P(x,t|x_0,0) = \frac{1}{\sqrt{4\pi D t}} \exp\left[-\frac{(x-x_0)^2}{4Dt}\right]",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE, color=YELLOW)),
+        (r"D = \frac{k_B T}{6\pi \eta a}",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE, color=WHITE)),
+        (r"\frac{\partial u}{\partial t} = \alpha \nabla^2 u",
+         dict(font_size=DEFAULT_EQUATION_FONT_SIZE, color=GREEN)),
+    ]
+    
     def construct(self):
         self.camera.background_color = "#001122"
         
+        # Single random generator shared by every section
+        self.rng = np.random.default_rng(RANDOM_SEED)
+        
         self.intro_sequence()  # 0-15s
         self.microscopic_brownian_motion()  # 15-45s
         self.random_walk_analysis()  # 45-70s
@@ -70,41 +90,38 @@ class BrownianMotionManaged(ManagedBoundedScene):
         )
         self.play(Write(title), run_time=1)
         
+        water_lo, water_hi = np.array([-6.0, -3.0]), np.array([6.0, 3.0])
+        pollen_lo, pollen_hi = np.array([-5, -2.5]), np.array([5, 2.5])
+        
         # Create particles (same as before)
-        water_molecules = VGroup()
         num_molecules = 200
-        for _ in range(num_molecules):
-            x = random.uniform(-6, 6)
-            y = random.uniform(-3, 3)
-            molecule = Dot(
-                point=[x, y, 0],
-                radius=0.05,
-                color=BLUE,
-                fill_opacity=0.6
-            )
-            water_molecules.add(molecule)
-        
-        pollen_grains = VGroup()
+        water_pos = self.rng.uniform(water_lo, water_hi, (num_molecules, 2))
+        # Build one styled molecule and copy it; copying skips the
+        # per-instance style derivation of a fresh Dot
+        molecule_template = Dot(radius=0.05, color=BLUE, fill_opacity=0.6)
+        water_molecules = VGroup(*[
+            molecule_template.copy().move_to([x, y, 0])
+            for x, y in water_pos
+        ])
+        
         num_pollen = 5
-        for i in range(num_pollen):
-            x = random.uniform(-4, 4)
-            y = random.uniform(-2, 2)
-            pollen = Circle(
-                radius=0.3,
-                color=GOLD,
-                fill_opacity=0.8,
-                stroke_width=2
-            ).move_to([x, y, 0])
-            pollen_grains.add(pollen)
-        
-        self.play(
-            *[FadeIn(mol) for mol in water_molecules],
-            run_time=2
-        )
-        self.play(
-            *[FadeIn(pollen) for pollen in pollen_grains],
-            run_time=1.5
+        pollen_pos = self.rng.uniform([-4, -2], [4, 2], (num_pollen, 2))
+        # Four quarter-arc curves are indistinguishable from the default
+        # eight at this radius and halve the points every copy and move touches
+        pollen_template = Dot(
+            radius=0.3,
+            color=GOLD,
+            fill_opacity=0.8,
+            stroke_width=2,
+            num_components=5
         )
+        pollen_grains = VGroup(*[
+            pollen_template.copy().move_to([x, y, 0])
+            for x, y in pollen_pos
+        ])
+        
+        self.play(FadeIn(water_molecules), run_time=2)
+        self.play(FadeIn(pollen_grains), run_time=1.5)
         
         # Add explanation (automatically positioned, no overlap)
         explanation = self.add_explanation(
@@ -116,38 +133,21 @@ class BrownianMotionManaged(ManagedBoundedScene):
         self.play(FadeIn(explanation), run_time=1)
         
         # Animate motion
-        pollen_trajectories = VGroup()
-        pollen_colors = [RED, GREEN, YELLOW, PURPLE, ORANGE]
-        
-        for i, pollen in enumerate(pollen_grains):
-            trail = TracedPath(
-                pollen.get_center,
-                stroke_color=pollen_colors[i % len(pollen_colors)],
-                stroke_width=3,
-                stroke_opacity=0.7
-            )
-            pollen_trajectories.add(trail)
+        # A single updater advances every particle on a fixed 0.1s step, so
+        # the scene schedules one wait instead of twenty
+        step_time, num_steps = 0.1, 20
         
+        # Every step is drawn up front; each tick only indexes a view
+        water_steps = self.rng.uniform(-0.3, 0.3, (num_steps, num_molecules, 2))
+        pollen_steps = self.rng.uniform(-0.2, 0.2, (num_steps, num_pollen, 2))
+        
+        advance_particles, pollen_trajectories = brownian_particle_stepper(
+            water_molecules, water_pos, water_steps, (water_lo, water_hi),
+            pollen_grains, pollen_pos, pollen_steps, (pollen_lo, pollen_hi)
+        )
         self.add(pollen_trajectories)
         
-        for frame in range(20):
-            for mol in water_molecules:
-                dx = random.uniform(-0.3, 0.3)
-                dy = random.uniform(-0.3, 0.3)
-                new_pos = mol.get_center() + np.array([dx, dy, 0])
-                new_pos[0] = np.clip(new_pos[0], -6, 6)
-                new_pos[1] = np.clip(new_pos[1], -3, 3)
-                mol.move_to(new_pos)
-            
-            for i, pollen in enumerate(pollen_grains):
-                dx = random.uniform(-0.2, 0.2)
-                dy = random.uniform(-0.2, 0.2)
-                new_pos = pollen.get_center() + np.array([dx, dy, 0])
-                new_pos[0] = np.clip(new_pos[0], -5, 5)
-                new_pos[1] = np.clip(new_pos[1], -2.5, 2.5)
-                pollen.move_to(new_pos)
-            
-            self.wait(0.1)
+        wait_fixed_steps(self, water_molecules, advance_particles, step_time, num_steps)
         
         self.wait(2)
         
@@ -182,20 +182,19 @@ class BrownianMotionManaged(ManagedBoundedScene):
         
         # Simulate trajectory
         num_steps = 50
-        positions = [0]
-        times = list(range(num_steps + 1))
+        steps = self.rng.uniform(-0.3, 0.3, num_steps)
         
-        for i in range(num_steps):
-            step = random.uniform(-0.3, 0.3)
-            positions.append(positions[-1] + step)
+        # (t, position) pairs are filled in place: the walk accumulates
+        # straight into the position column, starting from 0 at t = 0
+        walk_coords = np.zeros((num_steps + 1, 2))
+        walk_coords[:, 0] = np.arange(num_steps + 1)
+        np.cumsum(steps, out=walk_coords[1:, 1])
         
-        trajectory_points = [
-            axes.coords_to_point(t, pos)
-            for t, pos in zip(times, positions)
-        ]
+        # One affine transform converts every (t, position) pair
+        trajectory_points = coords_to_points(axes, walk_coords)
         
         trajectory = VMobject()
-        trajectory.set_points_as_corners(trajectory_points)
+        trajectory.points = corner_bezier_points(trajectory_points)
         trajectory.set_stroke(color=YELLOW, width=3)
         
         self.play(Create(trajectory), run_time=3)
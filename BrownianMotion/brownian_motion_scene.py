@@ -1,8 +1,24 @@
 from manim import *
 import numpy as np
-import random
+import sys
+from pathlib import Path
 
-class BrownianMotionAndEinsteinHeatEquation(Scene):
+# Add parent directory to path to import manim_utils
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from manim_utils.bounded_scene import (
+    PrecompiledMathTexMixin,
+    cached_math_tex,
+    cached_text,
+)
+from manim_utils.simulation import RANDOM_SEED, wait_fixed_steps
+from manim_utils.vectorized import (
+    coords_to_points,
+    corner_bezier_points,
+    random_walk_positions,
+)
+
+
+class BrownianMotionAndEinsteinHeatEquation(PrecompiledMathTexMixin, Scene):
     """
     2-minute (120 second) animation demonstrating Brownian Motion 
     and its connection to Einstein's Heat Equation.
@@ -10,10 +26,31 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
     Based on enriched JSON data from the KimiK2Manim pipeline.
     """
     
+    # Every equation built with cached_math_tex, compiled in parallel by
+    # the mixin's setup(); kwargs must match the call sites to hit the cache
+    precompiled_math_tex = [
+        (r"\langle x^2(t) \rangle = 2Dt", dict(font_size=36, color=GREEN)),
+        (r"\frac{\partial P}{\partial t} = D \nabla^2 P",
+         dict(font_size=48, color=WHITE)),
+        (r"P(x,t|x_0,0) = \frac{1}{\sqrt{4\pi D t}} \exp\left[-\frac{(x-x_0)^2}{4Dt}\right]",
+         dict(font_size=36, color=WHITE)),
+        (r"D = \frac{k_B T}{6\pi \eta a}", dict(font_size=48, color=WHITE)),
+        ((r"k_B: \text{Boltzmann constant}",
+          r"T: \text{temperature}",
+          r"\eta: \text{viscosity}",
+          r"a: \text{particle radius}"),
+         dict(arg_separator=r"\\", font_size=28, color=BLUE)),
+        (r"\frac{\partial u}{\partial t} = \alpha \nabla^2 u",
+         dict(font_size=44, color=WHITE)),
+    ]
+    
     def construct(self):
         # Set background
         self.camera.background_color = "#001122"
         
+        # Single random generator shared by every section
+        self.rng = np.random.default_rng(RANDOM_SEED)
+        
         # Timeline breakdown for 120 seconds:
         # [0-15s] Title and introduction
         # [15-45s] Microscopic Brownian motion visualization
@@ -31,7 +68,7 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
     
     def intro_sequence(self):
         """[0-15s] Title and introduction."""
-        title = Text(
+        title = cached_text(
             "Brownian Motion and Einstein's Heat Equation",
             font_size=48,
             color=GOLD,
@@ -39,14 +76,14 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         )
         title.to_edge(UP, buff=0.5)
         
-        subtitle = Text(
+        subtitle = cached_text(
             "Connecting microscopic random motion to macroscopic diffusion",
             font_size=28,
             color=WHITE
         ).next_to(title, DOWN, buff=0.3)
         
         # Historical context
-        context = Text(
+        context = cached_text(
             "Einstein (1905): Random molecular collisions explain\n"
             "the erratic motion of pollen grains in water",
             font_size=24,
@@ -60,84 +97,80 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         self.wait(2)
         
         # Transition
-        self.play(
-            FadeOut(title),
-            FadeOut(subtitle),
-            FadeOut(context),
-            run_time=2
-        )
+        self.play(FadeOut(VGroup(title, subtitle, context)), run_time=2)
         self.wait(1)
     
     def microscopic_brownian_motion(self):
         """[15-45s] Show microscopic view with pollen grains and water molecules."""
-        # Create water molecules (small blue dots)
-        water_molecules = VGroup()
+        rng = self.rng
+        water_lo, water_hi = np.array([-6.0, -3.0, 0.0]), np.array([6.0, 3.0, 0.0])
+        
+        # Create water molecules (small blue dots). All of them live in one
+        # VMobject whose points are the outline of a single Dot repeated at
+        # every position, so a frame is one set_points call, not 200 move_to
         num_molecules = 200
-        for _ in range(num_molecules):
-            x = random.uniform(-6, 6)
-            y = random.uniform(-3, 3)
-            molecule = Dot(
-                point=[x, y, 0],
-                radius=0.05,
-                color=BLUE,
-                fill_opacity=0.6
-            )
-            water_molecules.add(molecule)
+        water_pos = rng.uniform(water_lo, water_hi, (num_molecules, 3))
+        molecule = Dot(radius=0.05, color=BLUE, fill_opacity=0.6)
+        molecule_outline = molecule.points.copy()
+        water_molecules = VMobject().match_style(molecule)
+        water_molecules.set_points(
+            (water_pos[:, None] + molecule_outline).reshape(-1, 3)
+        )
         
-        # Create pollen grains (larger golden spheres)
-        pollen_grains = VGroup()
+        # Create pollen grains (larger golden spheres). Build one styled
+        # grain and copy it; copying skips the per-instance style derivation
+        # of a fresh Circle
         num_pollen = 5
-        pollen_positions = []
-        for i in range(num_pollen):
-            x = random.uniform(-4, 4)
-            y = random.uniform(-2, 2)
-            pollen = Circle(
-                radius=0.3,
-                color=GOLD,
-                fill_opacity=0.8,
-                stroke_width=2
-            ).move_to([x, y, 0])
-            pollen_grains.add(pollen)
-            pollen_positions.append([x, y])
+        pollen_template = Circle(
+            radius=0.3,
+            color=GOLD,
+            fill_opacity=0.8,
+            stroke_width=2
+        )
+        pollen_grains = VGroup(*[
+            pollen_template.copy().move_to([x, y, 0])
+            for x, y in rng.uniform([-4, -2], [4, 2], (num_pollen, 2))
+        ])
         
         # Label
-        label = Text(
+        label = cached_text(
             "Microscopic View: Pollen grains in water",
             font_size=32,
             color=WHITE
         ).to_edge(UP, buff=0.3)
         
         self.play(FadeIn(label), run_time=1)
-        self.play(
-            *[FadeIn(mol) for mol in water_molecules],
-            run_time=2
-        )
-        self.play(
-            *[FadeIn(pollen) for pollen in pollen_grains],
-            run_time=1.5
-        )
+        self.play(FadeIn(water_molecules), run_time=2)
+        self.play(FadeIn(pollen_grains), run_time=1.5)
         self.wait(1)
         
         # Animate Brownian motion
-        # Water molecules move randomly
-        water_animations = []
-        for mol in water_molecules:
-            for _ in range(10):
-                new_x = mol.get_center()[0] + random.uniform(-0.5, 0.5)
-                new_y = mol.get_center()[1] + random.uniform(-0.5, 0.5)
-                new_x = np.clip(new_x, -6, 6)
-                new_y = np.clip(new_y, -3, 3)
-                water_animations.append(
-                    mol.animate.move_to([new_x, new_y, 0])
-                )
-        
-        # Pollen grains jiggle due to collisions
+        # Positions are kept as (N, 3) arrays so each frame moves every
+        # particle with one batched random draw and one clip
+        num_frames = 20
+        pollen_lo, pollen_hi = np.array([-5.0, -2.5, 0.0]), np.array([5.0, 2.5, 0.0])
+        
+        # Pollen grains jiggle due to collisions. Their paths depend only on
+        # the random draws, so every frame is computed up front as a
+        # (num_pollen, num_frames + 1, 3) array
+        pollen_paths = np.empty((num_pollen, num_frames + 1, 3))
+        pollen_paths[:, 0] = [pollen.get_center() for pollen in pollen_grains]
+        pollen_steps = rng.uniform(-0.2, 0.2, (num_frames, num_pollen, 2))
+        for frame in range(num_frames):
+            next_pos = pollen_paths[:, frame + 1]
+            next_pos[:] = pollen_paths[:, frame]
+            next_pos[:, :2] += pollen_steps[frame]
+            np.clip(next_pos, pollen_lo, pollen_hi, out=next_pos)
+        
+        # Trails reveal a growing slice of each precomputed path, replacing
+        # the per-frame TracedPath updaters. The bezier points of every full
+        # path are built once; frame k shows the first k segments
+        trail_points = corner_bezier_points(pollen_paths)
         pollen_trajectories = VGroup()
         pollen_colors = [RED, GREEN, YELLOW, PURPLE, ORANGE]
         
-        for i, pollen in enumerate(pollen_grains):
-            trail = TracedPath(
-                pollen.get_center,
+        for i in range(num_pollen):
+            trail = VMobject(
                 stroke_color=pollen_colors[i % len(pollen_colors)],
                 stroke_width=3,
                 stroke_opacity=0.7
@@ -146,49 +179,55 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         
         self.add(pollen_trajectories)
         
-        # Animate motion
-        for frame in range(20):
+        # Animate motion, drawing every frame's water steps in one slab. A
+        # single updater advances every particle on a fixed 0.1s step, so the
+        # motion is one wait instead of twenty separate partial movies
+        water_steps = rng.uniform(-0.3, 0.3, (num_frames, num_molecules, 2))
+        step_time = 0.1
+        
+        # Everything the step touches is allocated or looked up once here:
+        # the molecule points are rebuilt in one reused buffer, and each
+        # grain is shifted by its precomputed path delta through a bound
+        # method, which also skips move_to's bounding-box pass
+        water_points = np.empty((num_molecules, len(molecule_outline), 3))
+        water_points_flat = water_points.reshape(-1, 3)
+        pollen_deltas = np.diff(pollen_paths, axis=1)
+        shift_pollen = [pollen.shift for pollen in pollen_grains]
+        
+        def advance_particles(frame):
             # Move water molecules
-            for mol in water_molecules:
-                dx = random.uniform(-0.3, 0.3)
-                dy = random.uniform(-0.3, 0.3)
-                new_pos = mol.get_center() + np.array([dx, dy, 0])
-                new_pos[0] = np.clip(new_pos[0], -6, 6)
-                new_pos[1] = np.clip(new_pos[1], -3, 3)
-                mol.move_to(new_pos)
-            
-            # Move pollen grains (jiggle)
-            for i, pollen in enumerate(pollen_grains):
-                dx = random.uniform(-0.2, 0.2)
-                dy = random.uniform(-0.2, 0.2)
-                new_pos = pollen.get_center() + np.array([dx, dy, 0])
-                new_pos[0] = np.clip(new_pos[0], -5, 5)
-                new_pos[1] = np.clip(new_pos[1], -2.5, 2.5)
-                pollen.move_to(new_pos)
+            water_pos[:, :2] += water_steps[frame]
+            np.clip(water_pos, water_lo, water_hi, out=water_pos)
+            np.add(water_pos[:, None], molecule_outline, out=water_points)
+            water_molecules.points = water_points_flat
             
-            self.wait(0.1)
+            # Move pollen grains (jiggle) along their paths
+            for shift, trail, deltas, points in zip(
+                shift_pollen, pollen_trajectories, pollen_deltas, trail_points
+            ):
+                shift(deltas[frame])
+                trail.points = points[:4 * (frame + 1)]
         
+        wait_fixed_steps(self, water_molecules, advance_particles, step_time, num_frames)
+        
+        # Nothing moves from here, so manim renders this as one frozen frame
         self.wait(2)
         
-        # Store for later use
-        self.water_molecules = water_molecules
-        self.pollen_grains = pollen_grains
-        self.pollen_trajectories = pollen_trajectories
-        self.label = label
+        # Everything shown in this section, faded out together by the next
+        self.section_content = VGroup(
+            water_molecules,
+            pollen_grains,
+            pollen_trajectories,
+            label
+        )
     
     def random_walk_analysis(self):
         """[45-70s] Show random walk trajectories and mean squared displacement."""
         # Transition
-        self.play(
-            FadeOut(self.water_molecules),
-            FadeOut(self.pollen_grains),
-            FadeOut(self.pollen_trajectories),
-            FadeOut(self.label),
-            run_time=2
-        )
+        self.play(FadeOut(self.section_content), run_time=2)
         
         # New title
-        title = Text(
+        title = cached_text(
             "Random Walk Analysis",
             font_size=40,
             color=GOLD
@@ -213,21 +252,15 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         
         # Simulate random walk trajectory
         num_steps = 50
-        positions = [0]
-        times = list(range(num_steps + 1))
-        
-        for i in range(num_steps):
-            step = random.uniform(-0.3, 0.3)
-            positions.append(positions[-1] + step)
+        times = np.arange(num_steps + 1)
+        positions = random_walk_positions(self.rng.uniform(-0.3, 0.3, num_steps))
         
         # Plot trajectory
-        trajectory_points = [
-            axes.coords_to_point(t, pos)
-            for t, pos in zip(times, positions)
-        ]
+        # One affine transform converts every (t, position) pair
+        trajectory_points = coords_to_points(axes, np.column_stack([times, positions]))
         
         trajectory = VMobject()
-        trajectory.set_points_as_corners(trajectory_points)
+        trajectory.points = corner_bezier_points(trajectory_points)
         trajectory.set_stroke(color=YELLOW, width=3)
         
         # Animate trajectory drawing
@@ -235,7 +268,7 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         self.wait(1)
         
         # Add MSD graph on the right
-        msd_title = Text(
+        msd_title = cached_text(
             "Mean Squared Displacement",
             font_size=28,
             color=WHITE
@@ -263,19 +296,17 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         
         # Plot MSD = 2Dt (linear relationship)
         D = 0.1  # Diffusion coefficient
-        msd_points = [
-            msd_axes.coords_to_point(t, 2 * D * t)
-            for t in np.linspace(0, 10, 50)
-        ]
+        msd_t = np.linspace(0, 10, 50)
+        msd_points = coords_to_points(msd_axes, np.column_stack([msd_t, 2 * D * msd_t]))
         
         msd_curve = VMobject()
-        msd_curve.set_points_as_corners(msd_points)
+        msd_curve.points = corner_bezier_points(msd_points)
         msd_curve.set_stroke(color=GREEN, width=4)
         
         self.play(Create(msd_curve), run_time=2)
         
         # Show equation
-        msd_eq = MathTex(
+        msd_eq = cached_math_tex(
             r"\langle x^2(t) \rangle = 2Dt",
             font_size=36,
             color=GREEN
@@ -284,29 +315,23 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         self.play(Write(msd_eq), run_time=1.5)
         self.wait(2)
         
-        # Store
-        self.title_rw = title
-        self.axes = axes
-        self.trajectory = trajectory
-        self.msd_axes = msd_axes
-        self.msd_curve = msd_curve
-        self.msd_eq = msd_eq
+        # Everything shown in this section, faded out together by the next
+        self.section_content = VGroup(
+            title,
+            axes,
+            trajectory,
+            msd_axes,
+            msd_curve,
+            msd_eq
+        )
     
     def diffusion_equation(self):
         """[70-95s] Derive and show the diffusion equation."""
         # Transition
-        self.play(
-            FadeOut(self.title_rw),
-            FadeOut(self.axes),
-            FadeOut(self.trajectory),
-            FadeOut(self.msd_axes),
-            FadeOut(self.msd_curve),
-            FadeOut(self.msd_eq),
-            run_time=2
-        )
+        self.play(FadeOut(self.section_content), run_time=2)
         
         # Title
-        title = Text(
+        title = cached_text(
             "The Diffusion Equation",
             font_size=40,
             color=GOLD
@@ -314,7 +339,7 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         self.play(Write(title), run_time=1)
         
         # Show the PDE
-        diffusion_eq = MathTex(
+        diffusion_eq = cached_math_tex(
             r"\frac{\partial P}{\partial t} = D \nabla^2 P",
             font_size=48,
             color=WHITE
@@ -324,21 +349,21 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         
         # Explanation
         explanation = VGroup(
-            Text("P(x,t): probability density", font_size=24, color=BLUE),
-            Text("D: diffusion coefficient", font_size=24, color=BLUE),
-            Text("∇²: Laplacian operator", font_size=24, color=BLUE)
+            cached_text("P(x,t): probability density", font_size=24, color=BLUE),
+            cached_text("D: diffusion coefficient", font_size=24, color=BLUE),
+            cached_text("∇²: Laplacian operator", font_size=24, color=BLUE)
         ).arrange(DOWN, buff=0.3).next_to(diffusion_eq, DOWN, buff=0.8)
         
-        self.play(*[FadeIn(exp) for exp in explanation], run_time=2)
+        self.play(FadeIn(explanation), run_time=2)
         
         # Show solution (Gaussian spreading)
-        solution_title = Text(
+        solution_title = cached_text(
             "Solution: Gaussian spreading",
             font_size=32,
             color=YELLOW
         ).next_to(explanation, DOWN, buff=0.8)
         
-        solution_eq = MathTex(
+        solution_eq = cached_math_tex(
             r"P(x,t|x_0,0) = \frac{1}{\sqrt{4\pi D t}} \exp\left[-\frac{(x-x_0)^2}{4Dt}\right]",
             font_size=36,
             color=WHITE
@@ -361,50 +386,45 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         
         # Animate Gaussian spreading over time
         gaussians = VGroup()
-        times = [0.5, 1.0, 2.0, 4.0]
+        times = np.array([0.5, 1.0, 2.0, 4.0])
         colors = [RED, YELLOW, GREEN, BLUE]
         D = 0.5
         
-        for t, color in zip(times, colors):
-            x_vals = np.linspace(-3, 3, 100)
-            y_vals = (1 / np.sqrt(4 * np.pi * D * t)) * np.exp(-(x_vals**2) / (4 * D * t))
-            points = [
-                gaussian_axes.coords_to_point(x, y)
-                for x, y in zip(x_vals, y_vals)
-            ]
+        # Evaluate all curves in one broadcast (rows are times) and map every
+        # sample to the scene with a single affine transform
+        x_vals = np.linspace(-3, 3, 100)
+        inv_4Dt = 1 / (4 * D * times[:, None])
+        y_vals = np.sqrt(inv_4Dt / np.pi) * np.exp(-(x_vals**2) * inv_4Dt)
+        coords = np.stack(np.broadcast_arrays(x_vals, y_vals), axis=-1)
+        curve_points = corner_bezier_points(coords_to_points(gaussian_axes, coords))
+        
+        for points, color in zip(curve_points, colors):
             curve = VMobject()
-            curve.set_points_as_corners(points)
+            curve.points = points
             curve.set_stroke(color=color, width=3)
             gaussians.add(curve)
         
-        self.play(*[Create(g) for g in gaussians], run_time=3)
+        self.play(Create(gaussians, lag_ratio=0), run_time=3)
         self.wait(2)
         
-        # Store
-        self.title_diff = title
-        self.diffusion_eq = diffusion_eq
-        self.explanation = explanation
-        self.solution_title = solution_title
-        self.solution_eq = solution_eq
-        self.gaussian_axes = gaussian_axes
-        self.gaussians = gaussians
+        # Everything shown in this section, faded out together by the next
+        self.section_content = VGroup(
+            title,
+            diffusion_eq,
+            explanation,
+            solution_title,
+            solution_eq,
+            gaussian_axes,
+            gaussians
+        )
     
     def einstein_relation(self):
         """[95-115s] Show Einstein's relation and connection to heat equation."""
         # Transition
-        self.play(
-            FadeOut(self.title_diff),
-            FadeOut(self.diffusion_eq),
-            FadeOut(self.explanation),
-            FadeOut(self.solution_title),
-            FadeOut(self.solution_eq),
-            FadeOut(self.gaussian_axes),
-            FadeOut(self.gaussians),
-            run_time=2
-        )
+        self.play(FadeOut(self.section_content), run_time=2)
         
         # Title
-        title = Text(
+        title = cached_text(
             "Einstein's Relation",
             font_size=40,
             color=GOLD
@@ -412,7 +432,7 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         self.play(Write(title), run_time=1)
         
         # Stokes-Einstein relation
-        einstein_eq = MathTex(
+        einstein_eq = cached_math_tex(
             r"D = \frac{k_B T}{6\pi \eta a}",
             font_size=48,
             color=WHITE
@@ -421,29 +441,33 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         self.play(Write(einstein_eq), run_time=2)
         
         # Definitions
-        definitions = VGroup(
-            MathTex(r"k_B: \text{Boltzmann constant}", font_size=28, color=BLUE),
-            MathTex(r"T: \text{temperature}", font_size=28, color=BLUE),
-            MathTex(r"\eta: \text{viscosity}", font_size=28, color=BLUE),
-            MathTex(r"a: \text{particle radius}", font_size=28, color=BLUE)
+        # One MathTex with a submobject per line, built by setup()
+        definitions = cached_math_tex(
+            r"k_B: \text{Boltzmann constant}",
+            r"T: \text{temperature}",
+            r"\eta: \text{viscosity}",
+            r"a: \text{particle radius}",
+            arg_separator=r"\\",
+            font_size=28,
+            color=BLUE
         ).arrange(DOWN, buff=0.3).next_to(einstein_eq, DOWN, buff=0.8)
         
-        self.play(*[FadeIn(defn) for defn in definitions], run_time=2)
+        self.play(FadeIn(definitions), run_time=2)
         
         # Connection to heat equation
-        connection_title = Text(
+        connection_title = cached_text(
             "Connection to Heat Equation",
             font_size=32,
             color=YELLOW
         ).next_to(definitions, DOWN, buff=0.8)
         
-        heat_eq = MathTex(
+        heat_eq = cached_math_tex(
             r"\frac{\partial u}{\partial t} = \alpha \nabla^2 u",
             font_size=44,
             color=WHITE
         ).next_to(connection_title, DOWN, buff=0.5)
         
-        connection_text = Text(
+        connection_text = cached_text(
             "Same mathematical structure!\n"
             "Probability density ↔ Temperature",
             font_size=24,
@@ -456,29 +480,23 @@ class BrownianMotionAndEinsteinHeatEquation(Scene):
         self.play(Write(connection_text), run_time=2)
         self.wait(2)
         
-        # Store
-        self.title_einstein = title
-        self.einstein_eq = einstein_eq
-        self.definitions = definitions
-        self.connection_title = connection_title
-        self.heat_eq = heat_eq
-        self.connection_text = connection_text
+        # Everything shown in this section, faded out together by the next
+        self.section_content = VGroup(
+            title,
+            einstein_eq,
+            definitions,
+            connection_title,
+            heat_eq,
+            connection_text
+        )
     
     def conclusion(self):
         """[115-120s] Conclusion."""
         # Transition
-        self.play(
-            FadeOut(self.title_einstein),
-            FadeOut(self.einstein_eq),
-            FadeOut(self.definitions),
-            FadeOut(self.connection_title),
-            FadeOut(self.heat_eq),
-            FadeOut(self.connection_text),
-            run_time=2
-        )
+        self.play(FadeOut(self.section_content), run_time=2)
         
         # Final message
-        conclusion = Text(
+        conclusion = cached_text(
             "Brownian motion connects\n"
             "microscopic randomness to\n"
             "macroscopic diffusion",
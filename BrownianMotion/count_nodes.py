@@ -1,39 +1,91 @@
 import json
+from collections import deque
 from pathlib import Path
 
-def count_nodes(node):
-    """Recursively count all nodes in the tree."""
-    count = 1
-    for prereq in node.get('prerequisites', []):
-        count += count_nodes(prereq)
-    return count
-
-def count_by_depth(node, depth=0):
-    """Count nodes at each depth level."""
-    counts = {}
-    counts[depth] = counts.get(depth, 0) + 1
-    for prereq in node.get('prerequisites', []):
-        sub_counts = count_by_depth(prereq, depth + 1)
-        for d, c in sub_counts.items():
-            counts[d] = counts.get(d, 0) + c
-    return counts
-
-def count_foundation_nodes(node):
-    """Count foundation nodes."""
-    count = 1 if node.get('is_foundation', False) else 0
-    for prereq in node.get('prerequisites', []):
-        count += count_foundation_nodes(prereq)
-    return count
+# ijson is optional; without it the tree is parsed whole with json.load
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+def summarize_tree(root):
+    """
+    Count total nodes, foundation nodes and nodes per depth in one pass.
+
+    Uses an explicit stack instead of recursion, so deep trees cannot hit
+    the recursion limit.
+
+    Returns:
+        Tuple of (total_nodes, foundation_nodes, depth_counts), where
+        depth_counts[d] is the number of nodes at depth d
+    """
+    total = 0
+    foundations = 0
+    depth_counts = []
+    stack = deque([(root, 0)])
+    while stack:
+        node, depth = stack.pop()
+        total += 1
+        if node.get('is_foundation', False):
+            foundations += 1
+        # A child is only reached after its parent, so depths appear in order
+        if depth == len(depth_counts):
+            depth_counts.append(0)
+        depth_counts[depth] += 1
+        prerequisites = node.get('prerequisites')
+        if prerequisites:
+            stack.extend((prereq, depth + 1) for prereq in prerequisites)
+    return total, foundations, depth_counts
+
+def summarize_tree_stream(f):
+    """
+    Same counts as summarize_tree, read from ijson parse events.
+
+    Nodes are the root map and the maps inside each prerequisites array,
+    so a node's prefix is "prerequisites.item" repeated once per depth.
+    The tree is never materialized.
+
+    Args:
+        f: Binary file object holding the tree JSON
+
+    Returns:
+        Tuple of (total_nodes, foundation_nodes, depth_counts)
+    """
+    total = 0
+    foundations = 0
+    depth_counts = []
+    node_depths = {'': 0}  # node prefix -> depth, filled as maps open
+    foundation_keys = {'is_foundation'}
+    for prefix, event, value in ijson.parse(f):
+        if event == 'start_map':
+            depth = node_depths.get(prefix)
+            if depth is None and prefix.endswith('prerequisites.item'):
+                parent = prefix[:-len('prerequisites.item')].rstrip('.')
+                if parent in node_depths:
+                    depth = node_depths[parent] + 1
+                    node_depths[prefix] = depth
+                    foundation_keys.add(prefix + '.is_foundation')
+            if depth is not None:
+                total += 1
+                if depth == len(depth_counts):
+                    depth_counts.append(0)
+                depth_counts[depth] += 1
+        elif event == 'boolean' and value and prefix in foundation_keys:
+            foundations += 1
+    return total, foundations, depth_counts
 
 # Load the prerequisite tree
 tree_file = Path("BrownianMotion/output/Brownian_Motion_and_Einstein's_Heat_Equation_prerequisite_tree.json")
-with open(tree_file, 'r', encoding='utf-8') as f:
-    tree = json.load(f)
+if IJSON_AVAILABLE:
+    with open(tree_file, 'rb') as f:
+        total_nodes, foundation_nodes, depth_counts = summarize_tree_stream(f)
+else:
+    with open(tree_file, 'r', encoding='utf-8') as f:
+        tree = json.load(f)
+    total_nodes, foundation_nodes, depth_counts = summarize_tree(tree)
 
-total_nodes = count_nodes(tree)
-foundation_nodes = count_foundation_nodes(tree)
 non_foundation_nodes = total_nodes - foundation_nodes
-depth_counts = count_by_depth(tree)
 
 print("="*70)
 print("Brownian Motion Pipeline API Call Estimation")
@@ -42,8 +94,8 @@ print(f"\nTotal nodes in tree: {total_nodes}")
 print(f"Foundation nodes: {foundation_nodes}")
 print(f"Non-foundation nodes: {non_foundation_nodes}")
 print(f"\nNodes by depth:")
-for depth in sorted(depth_counts.keys()):
-    print(f"  Depth {depth}: {depth_counts[depth]} nodes")
+for depth, count in enumerate(depth_counts):
+    print(f"  Depth {depth}: {count} nodes")
 
 # Calculate API calls
 # Stage 1: Prerequisite exploration
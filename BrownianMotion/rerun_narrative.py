@@ -8,6 +8,7 @@ to recover the missing narrative text.
 
 import asyncio
 import json
+import pickle
 import sys
 from pathlib import Path
 
@@ -22,9 +23,13 @@ from agents.prerequisite_explorer_kimi import KnowledgeNode
 from agents.enrichment_chain import KimiNarrativeComposer
 from logger import get_logger, reset_logger
 
+# Bump when KnowledgeNode or _build_tree_from_json changes, so sidecar
+# caches pickled from the old layout are rebuilt instead of loaded
+TREE_CACHE_VERSION = 1
 
-def load_tree_from_json(path: Path) -> KnowledgeNode:
-    """Load a KnowledgeNode from JSON."""
+
+def _build_tree_from_json(path: Path) -> KnowledgeNode:
+    """Parse the JSON file and rebuild the KnowledgeNode tree."""
     with path.open("r", encoding="utf-8") as f:
         data = json.load(f)
     
@@ -45,6 +50,40 @@ def load_tree_from_json(path: Path) -> KnowledgeNode:
     return _dict_to_node(data)
 
 
+def load_tree_from_json(path: Path) -> KnowledgeNode:
+    """
+    Load a KnowledgeNode from JSON.
+    
+    The built tree is pickled to a sidecar file keyed on TREE_CACHE_VERSION
+    and the JSON file's mtime and size, so re-runs skip parsing and node
+    construction until the JSON or the node layout changes.
+    
+    Unpickling runs arbitrary code, so the sidecar is trusted exactly as
+    much as the output directory it sits in; this script only reads
+    sidecars it wrote itself next to pipeline output.
+    """
+    cache_file = path.with_suffix(".tree.pkl")
+    stat = path.stat()
+    key = (TREE_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    
+    try:
+        with cache_file.open("rb") as f:
+            cached_key, tree = pickle.load(f)
+        if cached_key == key:
+            return tree
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError, TypeError, ValueError):
+        pass
+    
+    tree = _build_tree_from_json(path)
+    try:
+        with cache_file.open("wb") as f:
+            pickle.dump((key, tree), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return tree
+
+
 async def main():
     """Re-run narrative composition."""
     reset_logger()
@@ -60,13 +99,16 @@ async def main():
         logger.error(f"Enriched tree not found: {enriched_file}")
         sys.exit(1)
     
+    # Parse the tree on a worker thread while the composer and its client
+    # are set up on the loop
     logger.info(f"Loading enriched tree from: {enriched_file}")
-    tree = load_tree_from_json(enriched_file)
+    tree_task = asyncio.create_task(asyncio.to_thread(load_tree_from_json, enriched_file))
+    composer = KimiNarrativeComposer(logger=logger)
+    tree = await tree_task
     logger.success(f"Loaded tree with {len(tree.prerequisites)} top-level prerequisites")
     
     # Re-run narrative composition
     logger.info("\nRe-composing narrative...")
-    composer = KimiNarrativeComposer(logger=logger)
     narrative = await composer.compose_async(tree)
     
     # Save narrative
@@ -6,7 +6,9 @@ Emphasizes ThreeDScene rendering and artistic 3D presentation.
 """
 
 import asyncio
+import hashlib
 import json
+import sqlite3
 from pathlib import Path
 import sys
 
@@ -16,13 +18,80 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 load_dotenv()
 
-from agents.prerequisite_explorer_kimi import KimiPrerequisiteExplorer
-from agents.enrichment_chain import KimiEnrichmentPipeline
 from logger import get_logger, reset_logger
 
+# orjson is optional; without it trees are written with the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Upper bound on visual-design requests in flight at once, shared by the
+# whole tree walk
+MAX_CONCURRENT_DESIGNS = 5
+
+
+# 3D-focused visual-design system prompt. It is identical for every node, so
+# it is built once and each request sends the same prefix
+THREE_D_SYSTEM_PROMPT = (
+    "You are a 3D visual designer specializing in ThreeDScene animations for Manim. "
+    "CRITICAL: All animations MUST use ThreeDScene (not Scene) for full 3D rendering.\n\n"
+
+    "3D REQUIREMENTS:\n"
+    "- Use ThreeDAxes, Sphere, Surface, ParametricSurface for 3D objects\n"
+    "- Dynamic camera movements: orbits, rotations, zooms around 3D objects\n"
+    "- Show objects from multiple viewing angles\n"
+    "- Include depth cues: shadows, lighting, perspective\n"
+    "- Create immersive 3D experiences with artistic flair\n\n"
+
+    "For Minimal Surfaces:\n"
+    "- Visualize surfaces as translucent 3D objects\n"
+    "- Show wireframes and surface meshes in 3D space\n"
+    "- Demonstrate transformations between surfaces\n"
+    "- Use lighting to show curvature and form\n"
+    "- Include 3D coordinate systems\n"
+    "- Create cinematic, artistic presentations\n\n"
+
+    "Focus on describing the 3D visual content and effects, not specific implementation "
+    "details. Manim ThreeDScene will handle the rendering automatically. Respond by calling "
+    "the 'design_visual_plan' tool."
+)
+
+
+def write_tree_json(path: Path, data: dict) -> None:
+    """Write a tree dict as indented UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def open_response_cache(path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the on-disk cache of visual-design payloads."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, payload TEXT NOT NULL)")
+    return conn
+
+
+def response_cache_key(model: str, temperature: float, system_prompt: str, user_prompt: str) -> str:
+    """Hash everything that determines a response; a prompt edit is a new key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, repr(temperature), system_prompt, user_prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
 
 async def main():
     """Run the complete pipeline for Minimal Surfaces with 3D emphasis."""
+    # The agents pull in the API client; import them only once a run starts
+    from agents.prerequisite_explorer_kimi import KimiPrerequisiteExplorer
+    from agents.enrichment_chain import KimiEnrichmentPipeline
     
     # Reset logger
     reset_logger()
@@ -30,6 +99,8 @@ async def main():
     
     # Concept with explicit 3D emphasis
     concept = "Minimal Surfaces: Mathematical Soap Films in 3D Space"
+    # Filename prefix shared by every output file
+    slug = concept.translate(str.maketrans(" :", "__"))
     
     # Enhanced prompt emphasizing 3D visualization
     enhanced_concept = (
@@ -41,12 +112,15 @@ async def main():
         "from multiple angles. Emphasize depth, perspective, and immersive 3D experience."
     )
     
-    logger.info("="*70)
-    logger.info("Minimal Surfaces - 3D Visualization Pipeline")
-    logger.info("="*70)
-    logger.info(f"\nExploring concept: {concept}")
-    logger.info("\nEmphasis: ThreeDScene, 3D rendering, artistic presentation")
-    logger.info("="*70)
+    # Multi-line banners are joined and logged in one call each
+    logger.info("\n".join([
+        "="*70,
+        "Minimal Surfaces - 3D Visualization Pipeline",
+        "="*70,
+        f"\nExploring concept: {concept}",
+        "\nEmphasis: ThreeDScene, 3D rendering, artistic presentation",
+        "="*70,
+    ]))
     
     # Setup output directory
     output_dir = Path(__file__).parent / "output"
@@ -63,47 +137,57 @@ async def main():
     tree = await explorer.explore_async(enhanced_concept, verbose=True)
     logger.success(f"Tree built: {tree.depth} levels deep")
     
-    # Save intermediate tree
-    tree_file_intermediate = output_dir / f"{concept.replace(' ', '_').replace(':', '_')}_prerequisite_tree.json"
-    with open(tree_file_intermediate, 'w', encoding='utf-8') as f:
-        json.dump(tree.to_dict(), f, indent=2, ensure_ascii=False)
-    logger.success(f"Saved prerequisite tree: {tree_file_intermediate}")
+    # Save intermediate tree on a worker thread so the write overlaps the
+    # enrichment stage; the dict is snapshotted now, before enrichment
+    # starts filling the tree in
+    tree_file_intermediate = output_dir / f"{slug}_prerequisite_tree.json"
+    intermediate_write = asyncio.create_task(
+        asyncio.to_thread(write_tree_json, tree_file_intermediate, tree.to_dict())
+    )
     
     # Print tree structure
+    # The tree output is not ASCII-only, so check the stream
+    # encoding once instead of failing partway through printing
     if logger.verbose:
-        try:
+        if (sys.stdout.encoding or "").lower().startswith("utf"):
             tree.print_tree()
-        except UnicodeEncodeError:
-            logger.warning("Skipping tree visualization due to encoding issues")
+        else:
+            logger.warning("Skipping tree visualization: stdout encoding is not UTF")
     
     # Stage 2-4: Enrichment Pipeline
     logger.stage("Running Enrichment Pipeline (Math → Visual → Narrative)", 2, 3)
-    logger.info("\nThis will:")
-    logger.info("  - Enrich with mathematical content (equations, definitions)")
-    logger.info("  - Design 3D visual specifications (ThreeDScene, camera movements)")
-    logger.info("  - Compose narrative prompt (emphasizing 3D rendering)")
-    logger.info("\nNote: This may take several minutes...")
+    logger.info("\n".join([
+        "\nThis will:",
+        "  - Enrich with mathematical content (equations, definitions)",
+        "  - Design 3D visual specifications (ThreeDScene, camera movements)",
+        "  - Compose narrative prompt (emphasizing 3D rendering)",
+        "\nNote: This may take several minutes...",
+    ]))
     
     # Create pipeline
     pipeline = KimiEnrichmentPipeline(logger=logger)
     
     # Override the visual designer's _design_node method to use 3D-focused system prompt
     original_design_node = pipeline.visual._design_node
+    design_slots = asyncio.Semaphore(MAX_CONCURRENT_DESIGNS)
+    # Payloads persist across runs, so reruns only call the API for prompts
+    # that changed. Every access happens on the event loop thread.
+    response_cache = open_response_cache(output_dir / ".cache" / "visual.sqlite")
     
-    async def three_d_design_node(self, node, parent_spec=None):
-        """Design node with 3D emphasis."""
+    async def design_prerequisites(self, node, parent_spec):
+        """Design sibling prerequisites concurrently; one failure does not stop the rest."""
+        results = await asyncio.gather(
+            *(self._design_node(prereq, parent_spec) for prereq in node.prerequisites),
+            return_exceptions=True
+        )
+        for prereq, result in zip(node.prerequisites, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"3D visual design failed for '{prereq.concept}': {result}")
+    
+    async def request_visual_spec(self, node, parent_spec):
+        """Fetch the 3D visual spec for one node, without touching its prerequisites."""
         from agents.enrichment_chain import VISUAL_DESIGN_TOOL, _extract_tool_payload, _parse_json_fallback, VisualSpec
         
-        # Check cache first (same as original)
-        if node.concept in self.cache:
-            cached_spec = self.cache[node.concept]
-            if node.visual_spec is None:
-                node.visual_spec = {}
-            node.visual_spec.update(cached_spec.to_dict())
-            for prereq in node.prerequisites:
-                await self._design_node(prereq, cached_spec)
-            return cached_spec
-        
         # Build previous info
         previous_info = ""
         if parent_spec:
@@ -119,37 +203,12 @@ async def main():
                     f"Previous colors: {parent_spec.get('color_scheme', '')}\n"
                 )
         
-        # 3D-focused system prompt
-        system_prompt = (
-            "You are a 3D visual designer specializing in ThreeDScene animations for Manim. "
-            "CRITICAL: All animations MUST use ThreeDScene (not Scene) for full 3D rendering.\n\n"
-            
-            "3D REQUIREMENTS:\n"
-            "- Use ThreeDAxes, Sphere, Surface, ParametricSurface for 3D objects\n"
-            "- Dynamic camera movements: orbits, rotations, zooms around 3D objects\n"
-            "- Show objects from multiple viewing angles\n"
-            "- Include depth cues: shadows, lighting, perspective\n"
-            "- Create immersive 3D experiences with artistic flair\n\n"
-            
-            "For Minimal Surfaces:\n"
-            "- Visualize surfaces as translucent 3D objects\n"
-            "- Show wireframes and surface meshes in 3D space\n"
-            "- Demonstrate transformations between surfaces\n"
-            "- Use lighting to show curvature and form\n"
-            "- Include 3D coordinate systems\n"
-            "- Create cinematic, artistic presentations\n\n"
-            
-            "Focus on describing the 3D visual content and effects, not specific implementation "
-            "details. Manim ThreeDScene will handle the rendering automatically. Respond by calling "
-            "the 'design_visual_plan' tool."
-        )
-        
         user_prompt = (
             f"Concept: {node.concept}\n"
             f"Depth: {node.depth}\n"
             f"Is foundational: {node.is_foundation}\n"
             f"Equations to feature: {node.equations or 'None provided'}\n"
-            f"Prerequisites: {[p.concept for p in node.prerequisites]}\n"
+            f"Prerequisites: {sorted(p.concept for p in node.prerequisites)}\n"
             f"{previous_info}\n"
             "Describe what should appear visually in 3D space: what objects, shapes, or surfaces should be shown. "
             "Emphasize ThreeDScene rendering, 3D geometry, and artistic presentation. "
@@ -159,19 +218,39 @@ async def main():
             "Estimate duration in seconds."
         )
         
-        self.logger.info(f"Designing 3D visual: '{node.concept}' (depth {node.depth})", prefix="VISUAL")
-        response = self.client.chat_completion(
-            messages=[{"role": "user", "content": user_prompt}],
-            system=system_prompt,
-            tools=[VISUAL_DESIGN_TOOL],
-            tool_choice="auto",
-            temperature=0.4,
-            max_tokens=1200,
-        )
+        temperature = 0.4
+        cache_key = response_cache_key(self.client.model, temperature, THREE_D_SYSTEM_PROMPT, user_prompt)
+        row = response_cache.execute(
+            "SELECT payload FROM cache WHERE key = ?", (cache_key,)
+        ).fetchone()
         
-        payload = _extract_tool_payload(response)
-        if payload is None:
-            payload = _parse_json_fallback(self.client.get_text_content(response)) or {}
+        if row is not None:
+            self.logger.info(f"Using cached 3D visual: '{node.concept}' (depth {node.depth})", prefix="VISUAL")
+            payload = json.loads(row[0])
+        else:
+            # The client is synchronous, so each request runs on a worker thread;
+            # the semaphore is held only for the request, never across recursion
+            async with design_slots:
+                self.logger.info(f"Designing 3D visual: '{node.concept}' (depth {node.depth})", prefix="VISUAL")
+                response = await asyncio.to_thread(
+                    self.client.chat_completion,
+                    messages=[{"role": "user", "content": user_prompt}],
+                    system=THREE_D_SYSTEM_PROMPT,
+                    tools=[VISUAL_DESIGN_TOOL],
+                    tool_choice="auto",
+                    temperature=temperature,
+                    max_tokens=1200,
+                )
+            
+            payload = _extract_tool_payload(response)
+            if payload is None:
+                payload = _parse_json_fallback(self.client.get_text_content(response)) or {}
+            if payload:
+                with response_cache:
+                    response_cache.execute(
+                        "INSERT OR REPLACE INTO cache (key, payload) VALUES (?, ?)",
+                        (cache_key, json.dumps(payload, ensure_ascii=False))
+                    )
         
         visual_desc = payload.get('visual_description', '')[:150]
         color_scheme = payload.get('color_scheme', 'N/A')
@@ -184,16 +263,41 @@ async def main():
             self.logger.debug(f"  Animation: {animation}...")
         
         visual_spec = VisualSpec.from_payload(node.concept, payload)
+        self.cache[node.concept] = visual_spec
+        return visual_spec
+    
+    # Concepts shared between branches are requested once: later callers
+    # await the first caller's task instead of issuing a duplicate request.
+    # A failed task is dropped when it finishes, so later occurrences of the
+    # concept retry instead of re-raising the stale error
+    pending_designs = {}
+    
+    def forget_failed_design(concept, task):
+        if pending_designs.get(concept) is task and (
+            task.cancelled() or task.exception() is not None
+        ):
+            del pending_designs[concept]
+    
+    async def three_d_design_node(self, node, parent_spec=None):
+        """Design node with 3D emphasis."""
+        if node.concept in self.cache:
+            visual_spec = self.cache[node.concept]
+        else:
+            design = pending_designs.get(node.concept)
+            if design is None:
+                design = asyncio.create_task(request_visual_spec(self, node, parent_spec))
+                pending_designs[node.concept] = design
+                design.add_done_callback(
+                    lambda task, concept=node.concept: forget_failed_design(concept, task)
+                )
+            visual_spec = await design
         
         if node.visual_spec is None:
             node.visual_spec = {}
         node.visual_spec.update(visual_spec.to_dict())
         
-        self.cache[node.concept] = visual_spec
-        
         # Process prerequisites
-        for prereq in node.prerequisites:
-            await self._design_node(prereq, visual_spec)
+        await design_prerequisites(self, node, visual_spec)
         
         return visual_spec
     
@@ -201,19 +305,32 @@ async def main():
     pipeline.visual._design_node = three_d_design_node.__get__(pipeline.visual, type(pipeline.visual))
     
     # Run enrichment
-    result = await pipeline.run_async(tree)
+    try:
+        result = await pipeline.run_async(tree)
+    except BaseException:
+        # Let the intermediate write finish without masking the pipeline's
+        # own exception
+        try:
+            await intermediate_write
+        except Exception as e:
+            logger.warning(f"Could not save prerequisite tree: {e}")
+        raise
+    finally:
+        response_cache.close()
+    
+    await intermediate_write
+    logger.success(f"Saved prerequisite tree: {tree_file_intermediate}")
     
     # Stage 3: Save results
     logger.stage("Saving Results", 3, 3)
     
     # Save final enriched tree
-    tree_file = output_dir / f"{concept.replace(' ', '_').replace(':', '_')}_enriched.json"
-    with open(tree_file, 'w', encoding='utf-8') as f:
-        json.dump(tree.to_dict(), f, indent=2, ensure_ascii=False)
+    tree_file = output_dir / f"{slug}_enriched.json"
+    write_tree_json(tree_file, tree.to_dict())
     logger.success(f"Saved enriched tree: {tree_file}")
     
     # Save narrative
-    narrative_file = output_dir / f"{concept.replace(' ', '_').replace(':', '_')}_narrative.txt"
+    narrative_file = output_dir / f"{slug}_narrative.txt"
     with open(narrative_file, 'w', encoding='utf-8') as f:
         f.write(result.narrative.verbose_prompt)
     logger.success(f"Saved narrative: {narrative_file}")
@@ -221,25 +338,31 @@ async def main():
     # Print summary
     logger.info("\n" + "="*70)
     logger.success("Pipeline Complete!")
-    logger.info("="*70)
-    logger.info(f"\nTotal duration estimate: {result.narrative.total_duration} seconds")
-    logger.info(f"Narrative length: {len(result.narrative.verbose_prompt)} characters")
-    logger.info(f"Scene count: {result.narrative.scene_count}")
+    logger.info("\n".join([
+        "="*70,
+        f"\nTotal duration estimate: {result.narrative.total_duration} seconds",
+        f"Narrative length: {len(result.narrative.verbose_prompt)} characters",
+        f"Scene count: {result.narrative.scene_count}",
+    ]))
     
     if logger.verbose:
-        logger.info("\nNarrative preview (first 500 chars):")
-        logger.info("-" * 70)
         preview = result.narrative.verbose_prompt[:500]
-        logger.info(preview + "..." if len(result.narrative.verbose_prompt) > 500 else preview)
+        logger.info("\n".join([
+            "\nNarrative preview (first 500 chars):",
+            "-" * 70,
+            preview + "..." if len(result.narrative.verbose_prompt) > 500 else preview,
+        ]))
     
-    logger.info("\n" + "="*70)
-    logger.info("Next Steps:")
-    logger.info("="*70)
-    logger.info("1. Review the enriched JSON:", tree_file)
-    logger.info("2. Review the narrative:", narrative_file)
-    logger.info("3. Create Manim ThreeDScene using ManagedBoundedScene")
-    logger.info("4. Render with: python -m manim -pql minimal_surfaces_scene.py MinimalSurfaces3D")
-    logger.info("="*70)
+    logger.info("\n".join([
+        "\n" + "="*70,
+        "Next Steps:",
+        "="*70,
+        f"1. Review the enriched JSON: {tree_file}",
+        f"2. Review the narrative: {narrative_file}",
+        "3. Create Manim ThreeDScene using ManagedBoundedScene",
+        "4. Render with: python -m manim -pql minimal_surfaces_scene.py MinimalSurfaces3D",
+        "="*70,
+    ]))
     
     # Print logger summary
     logger.summary()
@@ -31,6 +31,15 @@ except ImportError:
 
 from .prerequisite_explorer_kimi import KnowledgeNode
 
+# orjson is optional; it parses the model's JSON payloads several times faster.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handlers
+# below catch failures from either parser.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 # ---------------------------------------------------------------------------
 # Shared helper utilities
@@ -60,7 +69,7 @@ def _extract_tool_payload(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        return json.loads(arguments)
+        return _json_loads(arguments)
     except json.JSONDecodeError:
         return None
 
@@ -71,7 +80,7 @@ def _parse_json_fallback(text: str) -> Optional[Dict[str, Any]]:
         return None
 
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except json.JSONDecodeError:
         # Attempt to extract JSON block from markdown fences
         if "```" in text:
@@ -81,7 +90,7 @@ def _parse_json_fallback(text: str) -> Optional[Dict[str, Any]]:
                 if normalized.startswith("json"):
                     normalized = normalized[4:].strip()
                 try:
-                    return json.loads(normalized)
+                    return _json_loads(normalized)
                 except json.JSONDecodeError:
                     continue
         return None
@@ -200,7 +209,9 @@ class KimiMathematicalEnricher:
         )
 
         self.logger.info(f"Enriching: '{node.concept}' (depth {node.depth})", prefix="MATH")
-        response = self.client.chat_completion(
+        # The client is synchronous; a worker thread keeps the event loop free
+        response = await asyncio.to_thread(
+            self.client.chat_completion,
             messages=[{"role": "user", "content": user_prompt}],
             system=system_prompt,
             tools=[MATHEMATICAL_CONTENT_TOOL],
@@ -391,7 +402,8 @@ class KimiVisualDesigner:
         )
 
         self.logger.info(f"Designing visuals for: '{node.concept}'", prefix="VISUAL")
-        response = self.client.chat_completion(
+        response = await asyncio.to_thread(
+            self.client.chat_completion,
             messages=[{"role": "user", "content": user_prompt}],
             system=system_prompt,
             tools=[VISUAL_DESIGN_TOOL],
@@ -527,7 +539,8 @@ class KimiNarrativeComposer:
 
         self.logger.info(f"Composing narrative for '{root.concept}'", prefix="NARRATIVE")
         self.logger.debug(f"  Concepts in order: {len(ordered_nodes)} node(s), estimated duration: {total_duration}s")
-        response = self.client.chat_completion(
+        response = await asyncio.to_thread(
+            self.client.chat_completion,
             messages=[{"role": "user", "content": user_prompt}],
             system=system_prompt,
             tools=[NARRATIVE_TOOL],
@@ -222,8 +222,10 @@ Answer with ONLY "yes" or "no"."""
 
         user_prompt = f'Is "{concept}" a foundational concept?'
 
-        # Make API call
-        response = self.client.chat_completion(
+        # Make API call. The client is synchronous, so it runs on a worker
+        # thread and the event loop stays free for other explorations
+        response = await asyncio.to_thread(
+            self.client.chat_completion,
             messages=[{"role": "user", "content": user_prompt}],
             system=system_prompt,
             max_tokens=50,  # Short response expected
@@ -270,7 +272,8 @@ Return format: ["concept1", "concept2", "concept3"]'''
         if self.use_tools and self.tools:
             # Try with tools first
             try:
-                response = self.client.chat_completion(
+                response = await asyncio.to_thread(
+                    self.client.chat_completion,
                     messages=[{"role": "user", "content": user_prompt}],
                     system=system_prompt,
                     tools=self.tools,
@@ -333,7 +336,8 @@ Return format: ["concept1", "concept2", "concept3"]'''
             )
 
         # Make API call
-        response = self.client.chat_completion(
+        response = await asyncio.to_thread(
+            self.client.chat_completion,
             messages=[{"role": "user", "content": enhanced_prompt}],
             system=system_prompt,
             max_tokens=1000,
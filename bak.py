@@ -11,7 +11,12 @@ License: MIT
 
 from manim import *
 import numpy as np
-import random
+
+# Seed for every scene's random Generator, so renders are reproducible.
+# Scene.__init__ sets self.random_seed to None, so the scenes read this
+# constant rather than a class attribute
+RANDOM_SEED = 0
+
 
 class BakSneppenEvolution3D(ThreeDScene):
     """
@@ -34,11 +39,24 @@ class BakSneppenEvolution3D(ThreeDScene):
     ANIMATION_SPEED = 0.5      # Seconds per iteration
     BAR_MAX_HEIGHT = 2.0       # Maximum height of fitness bars
     
+    # Red-to-green fitness colors, interpolated once; fitness_to_color
+    # indexes this instead of interpolating on every call
+    COLOR_LUT_SIZE = 256
+    COLOR_LUT = [
+        interpolate_color(RED, GREEN, alpha)
+        for alpha in np.linspace(0, 1, COLOR_LUT_SIZE)
+    ]
+    
     def construct(self):
         """Main orchestration method."""
         # Set up 3D environment
         self.setup_camera()
         
+        # Every random draw of the run comes from one generator; the three
+        # replacement fitnesses of each iteration are drawn up front
+        self.rng = np.random.default_rng(RANDOM_SEED)
+        self.replacement_fitness = self.rng.random((self.NUM_ITERATIONS, 3))
+        
         # Create scene elements
         title = self.create_title()
         species_vgroup, fitness_values = self.initialize_species()
@@ -98,38 +116,36 @@ class BakSneppenEvolution3D(ThreeDScene):
         
         Returns:
             species_vgroup: VGroup of all species objects
-            fitness_values: List of current fitness values
+            fitness_values: Array of current fitness values
         """
         self.species_objects = []
-        fitness_values = []
+        fitness_values = self.rng.random(self.NUM_SPECIES)
         
-        for i in range(self.NUM_SPECIES):
-            # Calculate position in circle
-            angle = 2 * np.pi * i / self.NUM_SPECIES
-            x = self.RADIUS * np.cos(angle)
-            y = self.RADIUS * np.sin(angle)
-            
-            # Generate random fitness
-            fitness = random.random()
-            fitness_values.append(fitness)
-            
+        # Tessellate one sphere and one unit-height bar; every species (and
+        # every later replacement bar) is a copy stretched and colored to fit
+        self.sphere_template = Sphere(
+            radius=self.SPHERE_RADIUS,
+            resolution=(16, 16)
+        )
+        self.bar_template = Cylinder(
+            radius=self.SPHERE_RADIUS * 0.6,
+            height=1.0,
+            resolution=(8, 8)
+        )
+        
+        # Positions around the circle, computed for all species at once
+        angles = np.linspace(0, 2 * np.pi, self.NUM_SPECIES, endpoint=False)
+        xs = self.RADIUS * np.cos(angles)
+        ys = self.RADIUS * np.sin(angles)
+        
+        for i, (x, y, fitness) in enumerate(zip(xs, ys, fitness_values)):
             # Create sphere representation
             color = self.fitness_to_color(fitness)
-            sphere = Sphere(
-                center=(x, y, 0),
-                radius=self.SPHERE_RADIUS,
-                resolution=(16, 16),
-                color=color
-            )
+            sphere = self.sphere_template.copy().move_to([x, y, 0]).set_color(color)
             
             # Create vertical fitness bar
             bar_height = fitness * self.BAR_MAX_HEIGHT
-            bar = Cylinder(
-                radius=self.SPHERE_RADIUS * 0.6,
-                height=bar_height,
-                color=color,
-                resolution=(8, 8)
-            )
+            bar = self.make_bar(bar_height, color)
             bar.move_to([x, y, bar_height / 2])
             
             # Add index label
@@ -151,6 +167,19 @@ class BakSneppenEvolution3D(ThreeDScene):
         
         return species_vgroup, fitness_values
     
+    def make_bar(self, height, color):
+        """
+        Copy the bar template, stretched along z to the given height.
+        
+        Args:
+            height: Bar height in scene units
+            color: Bar color
+            
+        Returns:
+            New Cylinder centered at the origin
+        """
+        return self.bar_template.copy().stretch_to_fit_depth(height).set_color(color)
+    
     def fitness_to_color(self, fitness):
         """
         Map fitness value to color gradient (red=0, green=1).
@@ -161,14 +190,14 @@ class BakSneppenEvolution3D(ThreeDScene):
         Returns:
             Manim color object
         """
-        return interpolate_color(RED, GREEN, fitness)
+        return self.COLOR_LUT[min(self.COLOR_LUT_SIZE - 1, int(fitness * self.COLOR_LUT_SIZE))]
     
     def create_fitness_graph(self, fitness_values):
         """
         Create real-time fitness distribution graph.
         
         Args:
-            fitness_values: Initial list of fitness values
+            fitness_values: Initial array of fitness values
             
         Returns:
             axes: Graph axes
@@ -210,9 +239,6 @@ class BakSneppenEvolution3D(ThreeDScene):
         graph_group = VGroup(axes, bars, x_label, y_label)
         self.add_fixed_in_frame_mobjects(graph_group)
         
-        # Store axes center for updates
-        self.graph_center = axes.get_center()
-        
         return axes, bars
     
     def create_iteration_counter(self):
@@ -226,14 +252,14 @@ class BakSneppenEvolution3D(ThreeDScene):
         
         Args:
             species_vgroup: VGroup of all species
-            fitness_values: List of current fitness values
+            fitness_values: Array of current fitness values
             graph_axes: Graph axes object
             bars: BarChart object
             iteration_label: Iteration counter display
         """
         for iteration in range(self.NUM_ITERATIONS):
             # Find species with minimum fitness
-            min_idx = fitness_values.index(min(fitness_values))
+            min_idx = int(np.argmin(fitness_values))
             neighbors = [
                 (min_idx - 1) % self.NUM_SPECIES,
                 min_idx,
@@ -263,7 +289,12 @@ class BakSneppenEvolution3D(ThreeDScene):
             self.highlight_species(min_idx, neighbors)
             
             # Replace species with new random fitness values
-            self.replace_species(min_idx, neighbors, fitness_values)
+            self.replace_species(
+                min_idx,
+                neighbors,
+                fitness_values,
+                self.replacement_fitness[iteration]
+            )
             
             # Update visualizations
             self.update_fitness_graph(bars, fitness_values)
@@ -296,30 +327,29 @@ class BakSneppenEvolution3D(ThreeDScene):
             ring.move_to(obj['sphere'].get_center())
             self.highlight_rings.add(ring)
         
-        self.play(Create(self.highlight_rings), run_time=0.3)
-        
-        # Pulse the central species
+        # Draw the rings, then pulse the central species, in one play call
         central_obj = self.species_objects[center_idx]
         self.play(
-            central_obj['sphere'].animate.scale(1.5),
-            rate_func=there_and_back,
-            run_time=0.3
+            Succession(
+                Create(self.highlight_rings),
+                central_obj['sphere'].animate(rate_func=there_and_back).scale(1.5)
+            ),
+            run_time=0.6
         )
     
-    def replace_species(self, center_idx, neighbor_indices, fitness_values):
+    def replace_species(self, center_idx, neighbor_indices, fitness_values, new_fitnesses):
         """
         Animate replacement of species with new fitness values.
         
         Args:
             center_idx: Center of avalanche
             neighbor_indices: All species to replace
-            fitness_values: List to update
+            fitness_values: Array to update in place
+            new_fitnesses: New fitness for each of neighbor_indices
         """
         animations = []
         
-        for idx in neighbor_indices:
-            # Generate new fitness
-            new_fitness = random.random()
+        for idx, new_fitness in zip(neighbor_indices, new_fitnesses):
             old_fitness = fitness_values[idx]
             
             # Update stored value
@@ -336,12 +366,7 @@ class BakSneppenEvolution3D(ThreeDScene):
             
             # Animate bar height change
             new_height = new_fitness * self.BAR_MAX_HEIGHT
-            new_bar = Cylinder(
-                radius=self.SPHERE_RADIUS * 0.6,
-                height=new_height,
-                color=new_color,
-                resolution=(8, 8)
-            )
+            new_bar = self.make_bar(new_height, new_color)
             new_bar.move_to([
                 obj['bar'].get_center()[0],
                 obj['bar'].get_center()[1],
@@ -355,24 +380,19 @@ class BakSneppenEvolution3D(ThreeDScene):
     
     def update_fitness_graph(self, bars, fitness_values):
         """Update the fitness distribution chart."""
-        # Create new bars with updated colors and heights
-        new_bars = BarChart(
-            values=fitness_values,
-            bar_names=[str(i) for i in range(self.NUM_SPECIES)],
-            y_range=[0, 1, 0.2],
-            x_length=4.5,
-            y_length=2.3,
-            bar_width=0.12,
-            bar_colors=[self.fitness_to_color(f) for f in fitness_values]
-        )
-        # Use stored center if available, otherwise fallback
-        if hasattr(self, 'graph_center'):
-            new_bars.move_to(self.graph_center)
-        else:
-            new_bars.to_corner(DL, buff=1.0)
-        
-        # Transform to new chart
-        self.play(Transform(bars, new_bars), run_time=0.3)
+        # Resize and recolor the existing bars instead of building a new
+        # BarChart, which would rebuild its axes and 30 tick labels. Only the
+        # bars group is copied as the target, not the whole chart. Bars are
+        # sized from the chart's own y scale (change_bar_values scales
+        # relative to values the chart has stored, which MoveToTarget does
+        # not carry back), with a floor so a bar can always grow again
+        unit_height = bars.c2p(0, 1)[1] - bars.c2p(0, 0)[1]
+        bars.bars.generate_target()
+        for bar, fitness in zip(bars.bars.target, fitness_values):
+            bar.stretch_to_fit_height(max(fitness, 1e-3) * unit_height, about_edge=DOWN)
+            bar.set_color(self.fitness_to_color(fitness))
+        
+        self.play(MoveToTarget(bars.bars), run_time=0.3)
     
     def update_iteration_counter(self, iteration_label, iteration):
         """Update iteration display."""
@@ -440,6 +460,22 @@ class BakSneppenHistogram(Scene):
     Demonstrates how the system approaches critical state.
     """
     
+    NUM_BINS = 20
+    NUM_ITERATIONS = 30
+    
+    def set_bar_heights(self, bars, counts, unit_height):
+        """
+        Stretch each histogram bar to its count, keeping its bottom edge.
+        
+        Args:
+            bars: VGroup of Rectangles, one per bin
+            counts: Count per bin
+            unit_height: Scene height of a count of 1
+        """
+        # A small floor keeps empty bins stretchable when they fill again
+        for bar, count in zip(bars, counts):
+            bar.stretch_to_fit_height(max(count, 1e-3) * unit_height, about_edge=DOWN)
+    
     def construct(self):
         # Title
         title = Text(
@@ -452,7 +488,9 @@ class BakSneppenHistogram(Scene):
         
         # Initial histogram (random distribution)
         num_species = 100
-        fitnesses = [random.random() for _ in range(num_species)]
+        rng = np.random.default_rng(RANDOM_SEED)
+        fitnesses = rng.random(num_species)
+        replacement_fitness = rng.random((self.NUM_ITERATIONS, 3))
         
         # Create axes
         axes = Axes(
@@ -464,13 +502,22 @@ class BakSneppenHistogram(Scene):
         )
         axes.shift(DOWN * 0.5)
         
-        # Histogram
-        hist = axes.plot_histogram(
-            fitnesses,
-            bins=20,
-            color=BLUE,
-            fill_opacity=0.7
-        )
+        # Histogram: one Rectangle per bin, built once. Each iteration only
+        # re-bins with np.histogram against the fixed edges and resizes them
+        edges = np.linspace(0, 1, self.NUM_BINS + 1)
+        unit_height = axes.c2p(0, 1)[1] - axes.c2p(0, 0)[1]
+        bin_width = axes.c2p(edges[1], 0)[0] - axes.c2p(edges[0], 0)[0]
+        hist = VGroup(*[
+            Rectangle(
+                width=bin_width,
+                height=1.0,
+                color=BLUE,
+                fill_opacity=0.7
+            ).move_to(axes.c2p(left, 0), aligned_edge=DL)
+            for left in edges[:-1]
+        ])
+        counts, _ = np.histogram(fitnesses, bins=edges)
+        self.set_bar_heights(hist, counts, unit_height)
         
         # Labels
         x_label = Text("Fitness", font_size=24)
@@ -482,9 +529,9 @@ class BakSneppenHistogram(Scene):
         self.add(axes, hist, x_label, y_label)
         
         # Simulate evolution
-        for _ in range(30):
+        for new_fitnesses in replacement_fitness:
             # Find min and neighbors
-            min_idx = fitnesses.index(min(fitnesses))
+            min_idx = int(np.argmin(fitnesses))
             neighbors = [
                 (min_idx - 1) % num_species,
                 min_idx,
@@ -492,18 +539,14 @@ class BakSneppenHistogram(Scene):
             ]
             
             # Replace
-            for idx in neighbors:
-                fitnesses[idx] = random.random()
+            fitnesses[neighbors] = new_fitnesses
             
             # Update histogram
-            new_hist = axes.plot_histogram(
-                fitnesses,
-                bins=20,
-                color=BLUE,
-                fill_opacity=0.7
-            )
+            counts, _ = np.histogram(fitnesses, bins=edges)
+            hist.generate_target()
+            self.set_bar_heights(hist.target, counts, unit_height)
             
-            self.play(Transform(hist, new_hist), run_time=0.2)
+            self.play(MoveToTarget(hist), run_time=0.2)
         
         # Show critical state
         critical_text = Text(
@@ -542,18 +585,16 @@ class BakSneppenAvalanche(ThreeDScene):
         num_species = 12
         radius = 3
         
+        rng = np.random.default_rng(RANDOM_SEED)
         species = []
-        fitnesses = []
+        fitnesses = rng.random(num_species)
         
-        for i in range(num_species):
+        for i, fitness in enumerate(fitnesses):
             angle = 2 * np.pi * i / num_species
             x = radius * np.cos(angle)
             y = radius * np.sin(angle)
             z = 0
             
-            fitness = random.random()
-            fitnesses.append(fitness)
-            
             # Sphere
             sphere = Sphere(
                 center=(x, y, z),
@@ -569,7 +610,7 @@ class BakSneppenAvalanche(ThreeDScene):
             self.add(sphere, label)
         
         # Show one avalanche in detail
-        min_idx = fitnesses.index(min(fitnesses))
+        min_idx = int(np.argmin(fitnesses))
         neighbors = [
             (min_idx - 1) % num_species,
             min_idx,
@@ -598,15 +639,13 @@ class BakSneppenAvalanche(ThreeDScene):
         
         self.play(Create(arrows))
         
-        # Animate replacements
-        for idx in neighbors:
-            new_fitness = random.random()
+        # Animate replacements one after another, in one play call
+        replacements = []
+        for idx, new_fitness in zip(neighbors, rng.random(len(neighbors))):
             new_color = interpolate_color(RED, GREEN, new_fitness)
-            
-            self.play(
-                species[idx][0].animate.set_color(new_color),
-                run_time=0.5
-            )
+            replacements.append(species[idx][0].animate.set_color(new_color))
+        
+        self.play(Succession(*replacements), run_time=0.5 * len(replacements))
         
         self.wait(1)
         self.play(FadeOut(highlight), FadeOut(arrows))
@@ -6,6 +6,11 @@ import numpy as np
 from math import sqrt
 
 class UltimateArtisticRhombicosidodecahedron(ThreeDScene):
+    # Pentagon, square and triangle edge widths
+    EDGE_STROKE_WIDTHS = (2.5, 2.0, 1.5)
+    # Background gradient, computed once when the class is defined
+    NEBULA_COLORS = color_gradient(["#000814", "#001d3d", "#003566", "#000814"], 4)
+
     def construct(self):
         # Configuration
         self.camera.background_color = "#000814"
@@ -19,69 +24,69 @@ class UltimateArtisticRhombicosidodecahedron(ThreeDScene):
         C3 = (5 + sqrt(5)) / 4
         C4 = (2 + sqrt(5)) / 2
 
-        # Vertex data (60 vertices)
-        vertices = [
-            np.array([ 0.5,  0.5,   C4]),  # V0
-            np.array([ 0.5,  0.5,  -C4]),  # V1
-            np.array([ 0.5, -0.5,   C4]),  # V2
-            np.array([ 0.5, -0.5,  -C4]),  # V3
-            np.array([-0.5,  0.5,   C4]),  # V4
-            np.array([-0.5,  0.5,  -C4]),  # V5
-            np.array([-0.5, -0.5,   C4]),  # V6
-            np.array([-0.5, -0.5,  -C4]),  # V7
-            np.array([  C4,  0.5,  0.5]),  # V8
-            np.array([  C4,  0.5, -0.5]),  # V9
-            np.array([  C4, -0.5,  0.5]),  # V10
-            np.array([  C4, -0.5, -0.5]),  # V11
-            np.array([ -C4,  0.5,  0.5]),  # V12
-            np.array([ -C4,  0.5, -0.5]),  # V13
-            np.array([ -C4, -0.5,  0.5]),  # V14
-            np.array([ -C4, -0.5, -0.5]),  # V15
-            np.array([ 0.5,   C4,  0.5]),  # V16
-            np.array([ 0.5,   C4, -0.5]),  # V17
-            np.array([ 0.5,  -C4,  0.5]),  # V18
-            np.array([ 0.5,  -C4, -0.5]),  # V19
-            np.array([-0.5,   C4,  0.5]),  # V20
-            np.array([-0.5,   C4, -0.5]),  # V21
-            np.array([-0.5,  -C4,  0.5]),  # V22
-            np.array([-0.5,  -C4, -0.5]),  # V23
-            np.array([ 0.0,   C1,   C3]),  # V24
-            np.array([ 0.0,   C1,  -C3]),  # V25
-            np.array([ 0.0,  -C1,   C3]),  # V26
-            np.array([ 0.0,  -C1,  -C3]),  # V27
-            np.array([  C3,  0.0,   C1]),  # V28
-            np.array([  C3,  0.0,  -C1]),  # V29
-            np.array([ -C3,  0.0,   C1]),  # V30
-            np.array([ -C3,  0.0,  -C1]),  # V31
-            np.array([  C1,   C3,  0.0]),  # V32
-            np.array([  C1,  -C3,  0.0]),  # V33
-            np.array([ -C1,   C3,  0.0]),  # V34
-            np.array([ -C1,  -C3,  0.0]),  # V35
-            np.array([  C1,   C0,   C2]),  # V36
-            np.array([  C1,   C0,  -C2]),  # V37
-            np.array([  C1,  -C0,   C2]),  # V38
-            np.array([  C1,  -C0,  -C2]),  # V39
-            np.array([ -C1,   C0,   C2]),  # V40
-            np.array([ -C1,   C0,  -C2]),  # V41
-            np.array([ -C1,  -C0,   C2]),  # V42
-            np.array([ -C1,  -C0,  -C2]),  # V43
-            np.array([  C2,   C1,   C0]),  # V44
-            np.array([  C2,   C1,  -C0]),  # V45
-            np.array([  C2,  -C1,   C0]),  # V46
-            np.array([  C2,  -C1,  -C0]),  # V47
-            np.array([ -C2,   C1,   C0]),  # V48
-            np.array([ -C2,   C1,  -C0]),  # V49
-            np.array([ -C2,  -C1,   C0]),  # V50
-            np.array([ -C2,  -C1,  -C0]),  # V51
-            np.array([  C0,   C2,   C1]),  # V52
-            np.array([  C0,   C2,  -C1]),  # V53
-            np.array([  C0,  -C2,   C1]),  # V54
-            np.array([  C0,  -C2,  -C1]),  # V55
-            np.array([ -C0,   C2,   C1]),  # V56
-            np.array([ -C0,   C2,  -C1]),  # V57
-            np.array([ -C0,  -C2,   C1]),  # V58
-            np.array([ -C0,  -C2,  -C1]),  # V59
-        ]
+        # Vertex data (60 vertices), one (60, 3) array
+        vertices = np.array([
+            ( 0.5,  0.5,   C4),  # V0
+            ( 0.5,  0.5,  -C4),  # V1
+            ( 0.5, -0.5,   C4),  # V2
+            ( 0.5, -0.5,  -C4),  # V3
+            (-0.5,  0.5,   C4),  # V4
+            (-0.5,  0.5,  -C4),  # V5
+            (-0.5, -0.5,   C4),  # V6
+            (-0.5, -0.5,  -C4),  # V7
+            (  C4,  0.5,  0.5),  # V8
+            (  C4,  0.5, -0.5),  # V9
+            (  C4, -0.5,  0.5),  # V10
+            (  C4, -0.5, -0.5),  # V11
+            ( -C4,  0.5,  0.5),  # V12
+            ( -C4,  0.5, -0.5),  # V13
+            ( -C4, -0.5,  0.5),  # V14
+            ( -C4, -0.5, -0.5),  # V15
+            ( 0.5,   C4,  0.5),  # V16
+            ( 0.5,   C4, -0.5),  # V17
+            ( 0.5,  -C4,  0.5),  # V18
+            ( 0.5,  -C4, -0.5),  # V19
+            (-0.5,   C4,  0.5),  # V20
+            (-0.5,   C4, -0.5),  # V21
+            (-0.5,  -C4,  0.5),  # V22
+            (-0.5,  -C4, -0.5),  # V23
+            ( 0.0,   C1,   C3),  # V24
+            ( 0.0,   C1,  -C3),  # V25
+            ( 0.0,  -C1,   C3),  # V26
+            ( 0.0,  -C1,  -C3),  # V27
+            (  C3,  0.0,   C1),  # V28
+            (  C3,  0.0,  -C1),  # V29
+            ( -C3,  0.0,   C1),  # V30
+            ( -C3,  0.0,  -C1),  # V31
+            (  C1,   C3,  0.0),  # V32
+            (  C1,  -C3,  0.0),  # V33
+            ( -C1,   C3,  0.0),  # V34
+            ( -C1,  -C3,  0.0),  # V35
+            (  C1,   C0,   C2),  # V36
+            (  C1,   C0,  -C2),  # V37
+            (  C1,  -C0,   C2),  # V38
+            (  C1,  -C0,  -C2),  # V39
+            ( -C1,   C0,   C2),  # V40
+            ( -C1,   C0,  -C2),  # V41
+            ( -C1,  -C0,   C2),  # V42
+            ( -C1,  -C0,  -C2),  # V43
+            (  C2,   C1,   C0),  # V44
+            (  C2,   C1,  -C0),  # V45
+            (  C2,  -C1,   C0),  # V46
+            (  C2,  -C1,  -C0),  # V47
+            ( -C2,   C1,   C0),  # V48
+            ( -C2,   C1,  -C0),  # V49
+            ( -C2,  -C1,   C0),  # V50
+            ( -C2,  -C1,  -C0),  # V51
+            (  C0,   C2,   C1),  # V52
+            (  C0,   C2,  -C1),  # V53
+            (  C0,  -C2,   C1),  # V54
+            (  C0,  -C2,  -C1),  # V55
+            ( -C0,   C2,   C1),  # V56
+            ( -C0,   C2,  -C1),  # V57
+            ( -C0,  -C2,   C1),  # V58
+            ( -C0,  -C2,  -C1),  # V59
+        ], dtype=np.float64)
 
         # Face data (62 faces: 12 pentagons, 30 squares, 20 triangles)
         faces = [
@@ -107,39 +112,47 @@ class UltimateArtisticRhombicosidodecahedron(ThreeDScene):
             [40, 56, 48], [41, 49, 57], [42, 50, 58], [43, 59, 51]
         ]
 
-        # Create edge sets by face type
-        pentagon_edges, square_edges, triangle_edges = set(), set(), set()
-        all_edges = set()
-
-        for i, face in enumerate(faces):
-            n = len(face)
-            for j in range(n):
-                v1, v2 = sorted([face[j], face[(j+1)%n]])
-                edge = (v1, v2)
-                if edge not in all_edges:
-                    all_edges.add(edge)
-                    if i < 12: pentagon_edges.add(edge)
-                    elif i < 42: square_edges.add(edge)
-                    else: triangle_edges.add(edge)
+        # Create edge arrays by face type. Faces of one type have the same
+        # length, so each type's edges come from pairing every vertex with the
+        # next one around its face (a roll along axis 1). An edge belongs to
+        # the first face type that reaches it, as (low, high) keys low*60+high
+        num_vertices = len(vertices)
+        claimed = np.empty(0, dtype=np.int64)
+        edge_arrays = []
+        for face_group in (faces[:12], faces[12:42], faces[42:]):
+            face_arr = np.array(face_group, dtype=np.int32)
+            pairs = np.stack([face_arr, np.roll(face_arr, -1, axis=1)], axis=-1).reshape(-1, 2)
+            pairs = np.sort(pairs, axis=1).astype(np.int64)
+            keys = np.setdiff1d(pairs[:, 0] * num_vertices + pairs[:, 1], claimed)
+            claimed = np.union1d(claimed, keys)
+            # Contiguous (E, 2) int32 index array. setdiff1d returns sorted
+            # keys, so rows are in (low, high) order and consecutive edges
+            # gather neighbouring vertex rows
+            edge_arrays.append(np.stack(np.divmod(keys, num_vertices), axis=1).astype(np.int32))
+        pentagon_edges, square_edges, triangle_edges = edge_arrays
 
         # **1. FRACTAL HIERARCHY**
         master_group = VGroup()
         scales = [2.0, 0.6, 0.18]  # 3 iterations for performance
         opacities = [1.0, 0.6, 0.3]
         
-        for i, (scale, opacity) in enumerate(zip(scales, opacities)):
-            poly = self.create_enhanced_polyhedron(
-                vertices, 
-                pentagon_edges, 
-                square_edges, 
-                triangle_edges,
-                scale=scale,
-                opacity=opacity,
-                iteration=i
-            )
+        # Build the outer polyhedron once; inner iterations are scaled,
+        # restyled copies rather than fresh Line3D and Sphere meshes
+        base_poly = self.create_enhanced_polyhedron(
+            vertices, 
+            pentagon_edges, 
+            square_edges, 
+            triangle_edges,
+            scale=scales[0],
+            opacity=opacities[0],
+            iteration=0
+        )
+        master_group.add(base_poly)
+        
+        for i, (scale, opacity) in enumerate(zip(scales[1:], opacities[1:]), start=1):
+            poly = self.instance_polyhedron(base_poly, scale / scales[0], opacity, iteration=i)
             # Offset inner iterations for visual depth
-            if i > 0:
-                poly.shift(i * 0.5 * OUT)
+            poly.shift(i * 0.5 * OUT)
             master_group.add(poly)
 
         # **2. ATMOSPHERIC LIGHTING**
@@ -162,6 +175,9 @@ class UltimateArtisticRhombicosidodecahedron(ThreeDScene):
         ), run_time=5)
 
         # Phase 2: Fractal breathing & rotation (5-18s)
+        # Current breath scale of each iteration, so each frame rescales relative to it
+        self.breath_scales = np.ones(len(master_group))
+        self.breath_phases = np.arange(len(master_group)) * PI / 3
         master_group.add_updater(lambda m, dt: self.fractal_breath(m, dt))
         self.wait(13)
 
@@ -180,45 +196,85 @@ class UltimateArtisticRhombicosidodecahedron(ThreeDScene):
     def create_enhanced_polyhedron(self, vertices, pentagon_edges, square_edges, triangle_edges, 
                                    scale=1.0, opacity=1.0, iteration=0):
         """Factory for polyhedron at different scales with gradient effects"""
+        # Scale every vertex once; edges and spheres index rows of this array
+        scaled = vertices * scale
         
         def create_gradient_edges(edges, color_palette, stroke_width):
-            group = VGroup()
-            for idx, (v1, v2) in enumerate(edges):
+            lines = []
+            # Gather all endpoints with one fancy index per column
+            starts = scaled[edges[:, 0]]
+            ends = scaled[edges[:, 1]]
+            for idx, (start, end) in enumerate(zip(starts, ends)):
                 # Create color gradient with iteration-specific hue shift
                 base_color = color_palette[idx % len(color_palette)]
                 shifted_color = interpolate_color(base_color, WHITE, iteration * 0.3)
                 
-                line = Line3D(
-                    start=vertices[v1] * scale,
-                    end=vertices[v2] * scale,
+                lines.append(Line3D(
+                    start=start,
+                    end=end,
                     color=shifted_color,
                     stroke_width=stroke_width * (1 - iteration * 0.2),
                     stroke_opacity=0.9 * opacity
-                )
-                
-                # **PULSE EFFECT** - varying stroke width over time
-                line.add_updater(lambda l, dt, base=stroke_width, i=iteration: 
-                    l.set_stroke(width=base * (1 + 0.3 * np.sin(self.time * 4 + i))))
-                group.add(line)
-            return group
+                ))
+            return lines
 
         # Color palettes for each iteration
         pentagon_colors = [ORANGE, GOLD_A, MAROON_A, PURE_RED]
         square_colors = [TEAL_E, BLUE_B, GREEN_B, PURPLE_B]
         triangle_colors = [PINK, LAVENDER, PURPLE_A, LIGHT_PINK]
 
-        pentagons = create_gradient_edges(pentagon_edges, pentagon_colors, 2.5)
-        squares = create_gradient_edges(square_edges, square_colors, 2.0)
-        triangles = create_gradient_edges(triangle_edges, triangle_colors, 1.5)
+        pentagon_width, square_width, triangle_width = self.EDGE_STROKE_WIDTHS
+        pentagons = create_gradient_edges(pentagon_edges, pentagon_colors, pentagon_width)
+        squares = create_gradient_edges(square_edges, square_colors, square_width)
+        triangles = create_gradient_edges(triangle_edges, triangle_colors, triangle_width)
 
         # **GLOWING VERTICES** with iteration-specific size
-        vertex_group = VGroup()
-        for v in vertices:
-            core = Sphere(radius=0.05 * scale, color=WHITE, resolution=(6, 6)).move_to(v * scale)
-            halo = Sphere(radius=0.12 * scale, color=WHITE, resolution=(6, 6)).set_opacity(0.12 * opacity).move_to(v * scale)
-            vertex_group.add(core, halo)
+        # Tessellate one core and one halo; each vertex gets copies
+        core_template = Sphere(radius=0.05 * scale, color=WHITE, resolution=(6, 6))
+        halo_template = Sphere(radius=0.12 * scale, color=WHITE, resolution=(6, 6)).set_opacity(0.12 * opacity)
+        spheres = []
+        for p in scaled:
+            spheres += [core_template.copy().move_to(p), halo_template.copy().move_to(p)]
 
-        return VGroup(pentagons, squares, triangles, vertex_group)
+        # One flat group, so the per-frame update walks a single level; the
+        # slices record which submobjects play which role
+        poly = VGroup(*pentagons, *squares, *triangles, *spheres)
+        bounds = np.cumsum([0, len(pentagons), len(squares), len(triangles)])
+        poly.edge_slices = [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        poly.vertex_slice = slice(bounds[-1], None)
+        
+        self.add_edge_pulse(poly, iteration)
+        return poly
+
+    def instance_polyhedron(self, base_poly, scale, opacity, iteration):
+        """Copy an iteration-0 polyhedron, scaled and restyled for another iteration"""
+        poly = base_poly.copy().scale(scale, about_point=ORIGIN)
+        
+        for edge_slice, stroke_width in zip(poly.edge_slices, self.EDGE_STROKE_WIDTHS):
+            # Same iteration-specific hue shift the factory applies
+            for line in poly.submobjects[edge_slice]:
+                line.set_color(interpolate_color(line.get_color(), WHITE, iteration * 0.3))
+                line.set_stroke(width=stroke_width * (1 - iteration * 0.2), opacity=0.9 * opacity)
+        
+        # Vertices alternate core, halo; only halos are translucent
+        for halo in poly.submobjects[poly.vertex_slice][1::2]:
+            halo.set_opacity(0.12 * opacity)
+        
+        # The copied pulse carries iteration 0's phase
+        poly.clear_updaters()
+        self.add_edge_pulse(poly, iteration)
+        return poly
+
+    def add_edge_pulse(self, poly, iteration):
+        """**PULSE EFFECT** - varying stroke width over time. Every edge
+        shares the phase, so one updater per polyhedron sets them all"""
+        def pulse(m, dt):
+            factor = 1 + 0.3 * np.sin(self.time * 4 + iteration)
+            for edge_slice, stroke_width in zip(m.edge_slices, self.EDGE_STROKE_WIDTHS):
+                for line in m.submobjects[edge_slice]:
+                    line.set_stroke(width=stroke_width * factor)
+        
+        poly.add_updater(pulse)
 
     def create_dynamic_lights(self):
         """Setup moving lights with different intensities and colors"""
@@ -242,20 +298,34 @@ class UltimateArtisticRhombicosidodecahedron(ThreeDScene):
         fill_light = AmbientLight(color=WHITE, intensity=0.25)
         
         # **ANIMATED LIGHT MOVEMENT**
-        key_light.add_updater(lambda l, dt: l.move_to(
-            6 * np.array([np.sin(self.time * 0.4), np.cos(self.time * 0.3), 0.4]) + 4 * RIGHT
-        ))
+        # Each light's target is written in place into one preallocated
+        # buffer, so the updaters allocate no arrays per frame
+        key_position = np.empty(3)
+        rim_position = np.empty(3)
+        
+        def move_key_light(l, dt):
+            # 6 * (sin, cos, 0.4) + 4 * RIGHT
+            key_position[0] = 6 * np.sin(self.time * 0.4) + 4
+            key_position[1] = 6 * np.cos(self.time * 0.3)
+            key_position[2] = 6 * 0.4
+            l.move_to(key_position)
         
-        rim_light.add_updater(lambda l, dt: l.move_to(
-            6 * np.array([np.cos(self.time * 0.35), np.sin(self.time * 0.5), 1]) + 5 * LEFT
-        ))
+        def move_rim_light(l, dt):
+            # 6 * (cos, sin, 1) + 5 * LEFT
+            rim_position[0] = 6 * np.cos(self.time * 0.35) - 5
+            rim_position[1] = 6 * np.sin(self.time * 0.5)
+            rim_position[2] = 6
+            l.move_to(rim_position)
+        
+        key_light.add_updater(move_key_light)
+        rim_light.add_updater(move_rim_light)
         
         return VGroup(key_light, rim_light, fill_light)
 
     def create_nebula_background(self):
         """Create atmospheric background gradient"""
         return FullScreenRectangle().set_color(
-            color_gradient(["#000814", "#001d3d", "#003566", "#000814"], 4)
+            self.NEBULA_COLORS
         ).set_opacity(0.5).scale(1.5)
 
     def setup_cinematic_camera(self):
@@ -271,16 +341,14 @@ class UltimateArtisticRhombicosidodecahedron(ThreeDScene):
 
     def fractal_breath(self, group, dt):
         """Complex breathing pattern with phase differences for each iteration"""
-        time = self.time
+        # Each iteration breathes at a different phase; all in one sin call
+        breaths = 1 + 0.04 * np.sin(2 * self.time + self.breath_phases)
+        # Apply new scale relative to the previous frame's
+        factors = breaths / self.breath_scales
+        self.breath_scales = breaths
         
-        for i, poly in enumerate(group):
-            # Each iteration breathes at different frequency/phase
-            breath_scale = 1 + 0.04 * np.sin(2 * time + i * PI / 3)
-            current_scale = poly.scale_factor if hasattr(poly, 'scale_factor') else 1.0
-            
-            # Apply new scale relative to original
-            poly.scale(breath_scale / current_scale)
-            poly.scale_factor = breath_scale
+        for i, (poly, factor) in enumerate(zip(group, factors)):
+            poly.scale(factor)
             
             # **INDIVIDUAL ROTATION** for inner iterations
             if i > 0:
@@ -323,5 +391,9 @@ class UltimateArtisticRhombicosidodecahedron(ThreeDScene):
 
 
 def normalize(v):
-    """Helper function for vector normalization"""
-    return v / np.linalg.norm(v)
\ No newline at end of file
+    """Helper function for vector normalization; rows of an (N, 3) array are normalized together"""
+    v = np.asarray(v, dtype=np.float64)
+    if v.ndim == 1:
+        # Plain arithmetic beats np.linalg.norm's dispatch for one 3-vector
+        return v * (1.0 / sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2]))
+    return v / np.sqrt(np.einsum('ij,ij->i', v, v))[:, None]
\ No newline at end of file
@@ -8,6 +8,7 @@ for exploring concepts with KimiK2 thinking and generating Manim animations.
 
 import asyncio
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 # Add parent directory to path
@@ -48,7 +49,7 @@ async def demo_basic_exploration():
     return result
 
 
-async def demo_visual_reasoning():
+async def demo_visual_reasoning(config=None):
     """Demonstrate visual reasoning capabilities."""
     logger.info("\n" + "="*60)
     logger.info("DEMO 2: Visual Reasoning Tests")
@@ -59,7 +60,8 @@ async def demo_visual_reasoning():
     from agents.prerequisite_explorer_kimi import KimiPrerequisiteExplorer
     from agents.enrichment_chain import KimiEnrichmentPipeline
 
-    config = setup_sandbox_environment()
+    if config is None:
+        config = setup_sandbox_environment()
 
     explorer = KimiPrerequisiteExplorer(
         max_depth=config.max_depth,
@@ -84,13 +86,14 @@ async def demo_visual_reasoning():
     return result
 
 
-async def demo_batch_exploration():
+async def demo_batch_exploration(config=None):
     """Demonstrate batch concept exploration."""
     logger.info("\n" + "="*60)
     logger.info("DEMO 3: Batch Exploration")
     logger.info("="*60)
 
-    config = setup_sandbox_environment()
+    if config is None:
+        config = setup_sandbox_environment()
     config.thinking_mode = "light"  # Use light mode for faster demo
 
     explorer = InteractiveExplorer(config)
@@ -117,13 +120,14 @@ async def demo_batch_exploration():
     return results
 
 
-async def demo_manim_rendering():
+async def demo_manim_rendering(config=None):
     """Demonstrate Manim rendering capabilities."""
     logger.info("\n" + "="*60)
     logger.info("DEMO 4: Manim Rendering")
     logger.info("="*60)
 
-    config = setup_sandbox_environment()
+    if config is None:
+        config = setup_sandbox_environment()
     renderer = ManimRenderer(config)
 
     # List available scenes
@@ -183,13 +187,14 @@ def demo_sandbox_tools():
     return storage
 
 
-async def demo_advanced_features():
+async def demo_advanced_features(config=None):
     """Demonstrate advanced sandbox features."""
     logger.info("\n" + "="*60)
     logger.info("DEMO 6: Advanced Features")
     logger.info("="*60)
 
-    config = setup_sandbox_environment()
+    if config is None:
+        config = setup_sandbox_environment()
 
     # 1. Custom configuration
     logger.info("\n1️⃣  Custom Configuration")
@@ -228,6 +233,16 @@ def count_nodes(tree_dict):
     return count
 
 
+async def run_demo(demo_func, config):
+    """Run one demo with a private copy of the shared sandbox config."""
+    if demo_func is demo_basic_exploration:
+        # quick_explore builds its own config from the environment
+        return await demo_func()
+    if asyncio.iscoroutinefunction(demo_func):
+        return await demo_func(replace(config))
+    return demo_func()
+
+
 async def run_all_demos():
     """Run all demonstration scenarios."""
     logger.info("🚀 KimiK2Manim E2B Sandbox - Complete Demo")
@@ -263,14 +278,37 @@ async def run_all_demos():
         ("Advanced Features", demo_advanced_features),
     ]
 
+    # The API-bound demos spend their time waiting on Moonshot, and the
+    # agents hand each request to a worker thread, so they run together on
+    # this loop. The environment was set up once above; each demo gets its
+    # own copy of the config because some of them change thinking_mode.
+    # Spinners are off meanwhile so concurrent calls only log plain lines.
+    # The local demos run afterwards, one at a time.
+    local_demos = {"Manim Rendering", "Sandbox Tools"}
+    api_demos = [(name, demo_func) for name, demo_func in demos if name not in local_demos]
+
+    logger.spinner_enabled = False
+    try:
+        outcomes = dict(zip(
+            (name for name, _ in api_demos),
+            await asyncio.gather(
+                *(run_demo(demo_func, config) for _, demo_func in api_demos),
+                return_exceptions=True
+            )
+        ))
+    finally:
+        logger.spinner_enabled = True
+
     results = {}
 
     for name, demo_func in demos:
         try:
-            if asyncio.iscoroutinefunction(demo_func):
-                result = await demo_func()
+            if name in outcomes:
+                result = outcomes[name]
+                if isinstance(result, Exception):
+                    raise result
             else:
-                result = demo_func()
+                result = await run_demo(demo_func, config)
 
             results[name] = {"success": True, "result": result}
 
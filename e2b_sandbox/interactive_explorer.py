@@ -109,7 +109,8 @@ class InteractiveExplorer:
     async def batch_explore(
         self,
         concepts: List[str],
-        enrichment: bool = False
+        enrichment: bool = False,
+        concurrency: int = 8
     ) -> List[dict]:
         """
         Explore multiple concepts in batch.
@@ -117,34 +118,41 @@ class InteractiveExplorer:
         Args:
             concepts: List of concepts to explore
             enrichment: Whether to run enrichment pipeline
+            concurrency: Maximum number of concepts explored at once
 
         Returns:
-            List of exploration results
+            List of exploration results, in the order of concepts
         """
         logger.info(f"🚀 Batch exploration: {len(concepts)} concepts")
 
-        results = []
-        for i, concept in enumerate(concepts, 1):
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Concept {i}/{len(concepts)}: {concept}")
-            logger.info(f"{'='*60}\n")
-
-            try:
-                result = await self.explore_concept(
-                    concept=concept,
-                    enrichment=enrichment,
-                    save_output=True
-                )
-                results.append(result)
-            except Exception as e:
-                logger.error(f"❌ Failed to explore '{concept}': {e}")
-                results.append({
-                    "concept": concept,
-                    "error": str(e),
-                    "success": False
-                })
-
-        return results
+        slots = asyncio.Semaphore(concurrency)
+
+        async def explore_one(i: int, concept: str) -> dict:
+            async with slots:
+                logger.info(f"\n{'='*60}")
+                logger.info(f"Concept {i}/{len(concepts)}: {concept}")
+                logger.info(f"{'='*60}\n")
+
+                try:
+                    # The agents hand each API request to a worker thread, so
+                    # explorations overlap on this loop while sharing the
+                    # explorer, pipeline and their caches
+                    return await self.explore_concept(
+                        concept=concept,
+                        enrichment=enrichment,
+                        save_output=True
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Failed to explore '{concept}': {e}")
+                    return {
+                        "concept": concept,
+                        "error": str(e),
+                        "success": False
+                    }
+
+        return await asyncio.gather(
+            *(explore_one(i, concept) for i, concept in enumerate(concepts, 1))
+        )
 
     def _serialize_tree(self, node, depth=0) -> dict:
         """Serialize knowledge tree to dictionary."""
@@ -11,7 +11,8 @@ import os
 import time
 from typing import Any, Dict, List, Optional, Union
 
-from openai import OpenAI
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 
 # Import config - works both as package and standalone
 try:
@@ -38,6 +39,21 @@ except ImportError:
     from logger import get_logger
 
 
+# Connection pool shared by every KimiClient in the process, so requests reuse
+# keep-alive connections instead of each client paying for its own handshakes.
+# DefaultHttpxClient keeps the SDK's default timeout and redirect settings
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_shared_http_client: Optional[httpx.Client] = None
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Get or create the process-wide pooled HTTP client."""
+    global _shared_http_client
+    if _shared_http_client is None:
+        _shared_http_client = DefaultHttpxClient(limits=HTTP_POOL_LIMITS)
+    return _shared_http_client
+
+
 class KimiClient:
     """
     Client for Kimi K2 thinking model from Moonshot AI.
@@ -80,6 +96,7 @@ class KimiClient:
         self.client = OpenAI(
             api_key=self.api_key,
             base_url=self.base_url,
+            http_client=get_shared_http_client(),
         )
 
     def chat_completion(
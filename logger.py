@@ -16,7 +16,7 @@ import platform
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
-from threading import Thread
+from threading import Event, RLock, Thread
 
 
 class PipelineLogger:
@@ -53,6 +53,18 @@ class PipelineLogger:
         self.api_call_count = 0
         self.total_api_time = 0.0
         
+        # API calls may run on several threads at once. The lock guards the
+        # counters and console writes; one spinner thread is shared by all
+        # calls in flight and stops when the last one finishes
+        self._lock = RLock()
+        self._calls_waiting = 0
+        self._spinner_thread = None
+        self._spinner_stop = None
+        
+        # Callers running many API calls at once can turn spinners off so
+        # the console only shows the start/end lines
+        self.spinner_enabled = True
+        
         # Use ASCII-safe characters on Windows
         if self._use_unicode:
             self.checkmark = "✓"
@@ -92,8 +104,7 @@ class PipelineLogger:
         timestamp = self._timestamp()
         elapsed = self._elapsed()
         colored_prefix = self._colorize(f"[{prefix}]", "BLUE")
-        print(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
-        sys.stdout.flush()
+        self._emit(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
     
     def success(self, message: str, prefix: str = None):
         """Log success message."""
@@ -102,24 +113,21 @@ class PipelineLogger:
         if prefix is None:
             prefix = self.checkmark
         colored_prefix = self._colorize(f"[{prefix}]", "GREEN")
-        print(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
-        sys.stdout.flush()
+        self._emit(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
     
     def warning(self, message: str, prefix: str = "WARN"):
         """Log warning message."""
         timestamp = self._timestamp()
         elapsed = self._elapsed()
         colored_prefix = self._colorize(f"[{prefix}]", "YELLOW")
-        print(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
-        sys.stdout.flush()
+        self._emit(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
     
     def error(self, message: str, prefix: str = "ERROR"):
         """Log error message."""
         timestamp = self._timestamp()
         elapsed = self._elapsed()
         colored_prefix = self._colorize(f"[{prefix}]", "RED")
-        print(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
-        sys.stdout.flush()
+        self._emit(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
     
     def debug(self, message: str, prefix: str = "DEBUG"):
         """Log debug message (only if verbose)."""
@@ -128,32 +136,32 @@ class PipelineLogger:
         timestamp = self._timestamp()
         elapsed = self._elapsed()
         colored_prefix = self._colorize(f"[{prefix}]", "DIM")
-        print(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
-        sys.stdout.flush()
+        self._emit(f"{timestamp} {colored_prefix} {message} {self._colorize(f'({elapsed})', 'DIM')}")
     
     def stage(self, stage_name: str, stage_num: int, total_stages: int):
         """Log pipeline stage start."""
         timestamp = self._timestamp()
         elapsed = self._elapsed()
         stage_info = self._colorize(f"[{stage_num}/{total_stages}]", "CYAN")
-        print(f"\n{timestamp} {stage_info} {self._colorize(stage_name, 'BOLD')} {self._colorize(f'({elapsed})', 'DIM')}")
-        sys.stdout.flush()
+        self._emit(f"\n{timestamp} {stage_info} {self._colorize(stage_name, 'BOLD')} {self._colorize(f'({elapsed})', 'DIM')}")
     
     def api_call_start(self, model: str, details: Optional[dict] = None):
         """Log API call start."""
-        self.api_call_count += 1
+        with self._lock:
+            self.api_call_count += 1
+            call_number = self.api_call_count
         timestamp = self._timestamp()
         elapsed = self._elapsed()
-        call_num = self._colorize(f"#{self.api_call_count}", "MAGENTA")
+        call_num = self._colorize(f"#{call_number}", "MAGENTA")
         model_name = self._colorize(model, "CYAN")
         
-        print(f"\n{timestamp} {call_num} {self._colorize('[API CALL]', 'BLUE')} Requesting {model_name} {self._colorize(f'({elapsed})', 'DIM')}")
+        lines = [f"\n{timestamp} {call_num} {self._colorize('[API CALL]', 'BLUE')} Requesting {model_name} {self._colorize(f'({elapsed})', 'DIM')}"]
         
         if details and self.verbose:
             for key, value in details.items():
                 if value:
-                    print(f"  {self._colorize(key + ':', 'DIM')} {value}")
-        sys.stdout.flush()
+                    lines.append(f"  {self._colorize(key + ':', 'DIM')} {value}")
+        self._emit("\n".join(lines))
     
     def api_call_end(self, success: bool = True, usage: Optional[dict] = None, duration: Optional[float] = None):
         """Log API call completion."""
@@ -168,7 +176,8 @@ class PipelineLogger:
         info_parts = [status]
         
         if duration is not None:
-            self.total_api_time += duration
+            with self._lock:
+                self.total_api_time += duration
             info_parts.append(self._colorize(f"{duration:.2f}s", "DIM"))
         
         if usage:
@@ -178,8 +187,7 @@ class PipelineLogger:
             if total_tokens > 0:
                 info_parts.append(f"{total_tokens} tokens ({prompt_tokens}+{completion_tokens})")
         
-        print(f"{timestamp} {self._colorize('[API RESPONSE]', 'BLUE')} {' | '.join(info_parts)} {self._colorize(f'({elapsed})', 'DIM')}")
-        sys.stdout.flush()
+        self._emit(f"{timestamp} {self._colorize('[API RESPONSE]', 'BLUE')} {' | '.join(info_parts)} {self._colorize(f'({elapsed})', 'DIM')}")
     
     def progress(self, current: int, total: int, item_name: str = "items"):
         """Log progress for batch operations."""
@@ -212,11 +220,9 @@ class PipelineLogger:
         start_time = time.time()
         call_info = {'success': True, 'usage': None, 'duration': None}
         
-        spinner_stop = [False]  # Use list for mutable reference
-        spinner_thread = None
+        show_spinner = show_spinner and self.spinner_enabled
         if show_spinner:
-            spinner_thread = Thread(target=self._spinner, args=(lambda: spinner_stop[0],), daemon=True)
-            spinner_thread.start()
+            self._spinner_acquire()
         
         try:
             yield call_info
@@ -226,9 +232,8 @@ class PipelineLogger:
             self.error(f"API call failed: {str(e)}")
             raise
         finally:
-            spinner_stop[0] = True
-            if spinner_thread:
-                spinner_thread.join(timeout=0.2)
+            if show_spinner:
+                self._spinner_release()
             duration = time.time() - start_time
             call_info['duration'] = duration
             self.api_call_end(
@@ -237,21 +242,52 @@ class PipelineLogger:
                 duration=duration
             )
     
-    def _spinner(self, stop_flag):
-        """Show spinner animation during API calls."""
+    def _emit(self, text: str):
+        """Print one log entry, clearing the spinner line first if it is showing."""
+        with self._lock:
+            if self._calls_waiting:
+                print("\r" + " " * 50 + "\r", end='')
+            print(text)
+            sys.stdout.flush()
+    
+    def _spinner_acquire(self):
+        """Register a call waiting on the API, starting the shared spinner if needed."""
+        with self._lock:
+            self._calls_waiting += 1
+            if self._spinner_thread is None:
+                self._spinner_stop = Event()
+                self._spinner_thread = Thread(target=self._spinner, args=(self._spinner_stop,), daemon=True)
+                self._spinner_thread.start()
+    
+    def _spinner_release(self):
+        """Unregister a waiting call; the last one stops the spinner."""
+        with self._lock:
+            self._calls_waiting -= 1
+            if self._calls_waiting:
+                return
+            spinner_thread, self._spinner_thread = self._spinner_thread, None
+            self._spinner_stop.set()
+        spinner_thread.join(timeout=0.2)
+    
+    def _spinner(self, stop_event: Event):
+        """Show spinner animation while any API call is waiting."""
         i = 0
-        while not stop_flag():
-            char = self.spinner_chars[i % len(self.spinner_chars)]
-            spinner_text = f"\r  {self._colorize(char, 'CYAN')} Waiting for API response..."
-            try:
-                print(spinner_text, end='', flush=True)
-            except UnicodeEncodeError:
-                # Fallback to ASCII if Unicode fails
-                print(f"\r  [{char}] Waiting for API response...", end='', flush=True)
-            time.sleep(0.1)
+        while not stop_event.is_set():
+            with self._lock:
+                char = self.spinner_chars[i % len(self.spinner_chars)]
+                waiting = self._calls_waiting
+                message = "Waiting for API response..." if waiting <= 1 else f"Waiting for {waiting} API responses..."
+                spinner_text = f"\r  {self._colorize(char, 'CYAN')} {message}"
+                try:
+                    print(spinner_text, end='', flush=True)
+                except UnicodeEncodeError:
+                    # Fallback to ASCII if Unicode fails
+                    print(f"\r  [{char}] {message}", end='', flush=True)
+            stop_event.wait(0.1)
             i += 1
         # Clear spinner line
-        print("\r" + " " * 50 + "\r", end='', flush=True)
+        with self._lock:
+            print("\r" + " " * 50 + "\r", end='', flush=True)
     
     def summary(self):
         """Print summary statistics."""
@@ -15,7 +15,10 @@ Solution: A base scene class that automatically constrains all content.
 
 from manim import *
 import numpy as np
-from typing import Union, Tuple
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Union, Tuple
 
 
 # Manim's default frame dimensions
@@ -31,8 +34,168 @@ SAFE_X_MAX = SAFE_WIDTH / 2  # 6.39
 SAFE_Y_MIN = -SAFE_HEIGHT / 2  # -3.6
 SAFE_Y_MAX = SAFE_HEIGHT / 2  # 3.6
 
+# Rendered Text and MathTex objects keyed on their construction arguments.
+# Building either parses SVG outlines every time (and MathTex may run LaTeX);
+# copying a cached instance skips that when the same string and style are
+# requested again, including across scenes rendered in one process.
+_TEXT_CACHE = {}
+_TEX_CACHE = {}
 
-class BoundedScene(Scene):
+
+# manim already names LaTeX and Text SVGs after a hash of their content and
+# skips the compile when the file exists, but it keeps them under media_dir,
+# which follows the working directory. Setting KIMIK2MANIM_SVG_CACHE to a
+# user-level directory lets every script and checkout reuse the same SVGs.
+SVG_CACHE_ENV = "KIMIK2MANIM_SVG_CACHE"
+
+
+def use_shared_svg_cache(cache_dir: Union[str, Path, None] = None) -> bool:
+    """
+    Point manim's Tex and Text SVG directories at a shared cache.
+    
+    This overrides config.tex_dir and config.text_dir, including values set
+    by --media_dir or manim.cfg, so it is opt-in: with no cache_dir it only
+    acts when KIMIK2MANIM_SVG_CACHE is set, and otherwise leaves manim's
+    configuration alone. Call before any MathTex or Text is built, e.g.
+    from Scene.setup().
+    
+    Args:
+        cache_dir: Directory holding the Tex/ and texts/ subdirectories;
+            defaults to $KIMIK2MANIM_SVG_CACHE
+    
+    Returns:
+        True if the SVG directories were redirected
+    """
+    cache_dir = cache_dir or os.environ.get(SVG_CACHE_ENV)
+    if not cache_dir:
+        return False
+    
+    cache_dir = Path(cache_dir).expanduser()
+    for name, subdir in (("tex_dir", "Tex"), ("text_dir", "texts")):
+        path = cache_dir / subdir
+        path.mkdir(parents=True, exist_ok=True)
+        setattr(config, name, str(path))
+    return True
+
+
+def _mobject_cache_key(content, font_size: float, kwargs: dict) -> tuple:
+    """Build a hashable cache key; kwargs may hold unhashable colors."""
+    return (content, font_size, repr(sorted(kwargs.items())))
+
+
+def cached_text(text: str, font_size: float = 36, **kwargs) -> Text:
+    """
+    Return a fresh copy of a Text built from the given arguments.
+    
+    The first call for a (text, font_size, kwargs) combination builds the
+    Text; later calls copy the cached instance, so callers can move and
+    scale the result freely.
+    
+    Args:
+        text: Text content
+        font_size: Font size
+        **kwargs: Additional arguments for Text()
+    
+    Returns:
+        New Text object
+    """
+    key = _mobject_cache_key(text, font_size, kwargs)
+    if key not in _TEXT_CACHE:
+        _TEXT_CACHE[key] = Text(text, font_size=font_size, **kwargs)
+    return _TEXT_CACHE[key].copy()
+
+
+def cached_math_tex(*tex_strings: str, font_size: float = 36, **kwargs) -> MathTex:
+    """
+    Return a fresh copy of a MathTex built from the given arguments.
+    
+    Works like cached_text(); the LaTeX compile and SVG parse happen once
+    per (tex_strings, font_size, kwargs) combination. Passing several
+    strings gives one MathTex with a submobject per string; manim may
+    compile the parts separately to split them, and the cache covers
+    those compiles too.
+    
+    Args:
+        *tex_strings: LaTeX source strings
+        font_size: Font size
+        **kwargs: Additional arguments for MathTex()
+    
+    Returns:
+        New MathTex object
+    """
+    key = _mobject_cache_key(tex_strings, font_size, kwargs)
+    if key not in _TEX_CACHE:
+        _TEX_CACHE[key] = MathTex(*tex_strings, font_size=font_size, **kwargs)
+    return _TEX_CACHE[key].copy()
+
+
+def precompile_math_tex(
+    specs: Iterable[Tuple[Union[str, Tuple[str, ...]], dict]],
+    max_workers: int = 8
+) -> None:
+    """
+    Build MathTex objects for many equations in parallel and cache them.
+    
+    LaTeX and dvisvgm run as subprocesses, so threads overlap those
+    compilations without contending for the GIL. Later cached_math_tex()
+    calls with the same arguments return copies without compiling.
+    
+    Args:
+        specs: (tex_string, kwargs) pairs, with kwargs exactly as they will
+            be passed to bounded_math_tex() or cached_math_tex() (font_size
+            included). tex_string may be a tuple of strings for a MathTex
+            built from several parts.
+        max_workers: Maximum number of concurrent compilations
+    """
+    pending = {}
+    for tex_strings, kwargs in specs:
+        if isinstance(tex_strings, str):
+            tex_strings = (tex_strings,)
+        kwargs = dict(kwargs)
+        font_size = kwargs.pop('font_size', 36)
+        key = _mobject_cache_key(tuple(tex_strings), font_size, kwargs)
+        if key not in _TEX_CACHE:
+            pending[key] = (tex_strings, font_size, kwargs)
+    
+    if not pending:
+        return
+    
+    def build(spec):
+        tex_strings, font_size, kwargs = spec
+        return MathTex(*tex_strings, font_size=font_size, **kwargs)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        _TEX_CACHE.update(zip(pending, executor.map(build, pending.values())))
+
+
+class PrecompiledMathTexMixin:
+    """
+    Scene mixin that compiles the declared equations before construct().
+    
+    setup() builds every entry of precompiled_math_tex in parallel, after
+    redirecting manim to the shared SVG cache if KIMIK2MANIM_SVG_CACHE is
+    set (see use_shared_svg_cache()). List it before Scene in the bases.
+    
+    Usage:
+        class MyScene(PrecompiledMathTexMixin, Scene):
+            precompiled_math_tex = [
+                (r"E = mc^2", dict(font_size=36, color=WHITE)),
+            ]
+    """
+    
+    # (tex_string, kwargs) pairs compiled in parallel before construct();
+    # subclasses list the equations they build with bounded_math_tex() or
+    # cached_math_tex()
+    precompiled_math_tex = ()
+    
+    def setup(self):
+        """Compile the declared equations before the first animation."""
+        super().setup()
+        use_shared_svg_cache()
+        precompile_math_tex(self.precompiled_math_tex)
+
+
+class BoundedScene(PrecompiledMathTexMixin, Scene):
     """
     Base Scene class that automatically constrains all content within frame boundaries.
     
@@ -75,7 +238,7 @@ class BoundedScene(Scene):
         max_width = max_width or self.safe_width
         max_height = max_height or self.safe_height
         
-        text_obj = Text(text, font_size=font_size, **kwargs)
+        text_obj = cached_text(text, font_size=font_size, **kwargs)
         
         # Scale down if too large
         if text_obj.width > max_width:
@@ -99,7 +262,7 @@ class BoundedScene(Scene):
         max_width = max_width or self.safe_width
         max_height = max_height or self.safe_height
         
-        tex_obj = MathTex(tex_string, font_size=font_size, **kwargs)
+        tex_obj = cached_math_tex(tex_string, font_size=font_size, **kwargs)
         
         if tex_obj.width > max_width:
             tex_obj.scale_to_fit_width(max_width)
@@ -150,26 +313,29 @@ class BoundedScene(Scene):
         Returns:
             Constrained mobject
         """
-        # Get bounding box
-        bbox = mobject.get_bounding_box()
-        width = bbox[1][0] - bbox[0][0]
-        height = bbox[1][1] - bbox[0][1]
+        # One pass over the points gives the box; scaling about the center
+        # keeps the center fixed, so the scaled box follows without a rescan
+        points = mobject.get_all_points()
+        if len(points) == 0:
+            return mobject
+        lower, upper = points.min(axis=0), points.max(axis=0)
+        center = (lower + upper) / 2
+        width = upper[0] - lower[0]
+        height = upper[1] - lower[1]
         
         # Scale if too large
+        factor = 1.0
         if width > self.safe_width:
-            mobject.scale_to_fit_width(self.safe_width)
-        if height > self.safe_height:
-            mobject.scale_to_fit_height(self.safe_height)
+            factor = self.safe_width / width
+        if height * factor > self.safe_height:
+            factor = self.safe_height / height
+        if factor < 1.0:
+            mobject.scale(factor, about_point=center)
+            width *= factor
+            height *= factor
         
-        # Ensure position is within bounds
-        center = mobject.get_center()
         x, y = center[0], center[1]
         
-        # Get updated bounding box after scaling
-        bbox = mobject.get_bounding_box()
-        width = bbox[1][0] - bbox[0][0]
-        height = bbox[1][1] - bbox[0][1]
-        
         # Adjust position if needed
         if x - width/2 < SAFE_X_MIN:
             mobject.shift(RIGHT * (SAFE_X_MIN - (x - width/2)))
@@ -307,7 +473,7 @@ def get_safe_font_size(text: str, max_width: float = SAFE_WIDTH, initial_size: i
     Returns:
         Safe font size
     """
-    test_text = Text(text, font_size=initial_size)
+    test_text = cached_text(text, font_size=initial_size)
     
     if test_text.width <= max_width:
         return initial_size
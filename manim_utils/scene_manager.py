@@ -86,12 +86,7 @@ class SceneManager:
         
         # Fade out previous content in this layer
         if fade_out_previous and layer in self.active_content:
-            previous = self.active_content[layer]
-            if previous:
-                self.scene.play(
-                    *[FadeOut(obj) for obj in previous],
-                    run_time=0.5
-                )
+            self._fade_out(self.active_content[layer], run_time=0.5)
         
         # Track this content
         if layer not in self.active_content:
@@ -146,20 +141,23 @@ class SceneManager:
     def clear_layer(self, layer: TextLayer, fade_out: bool = True):
         """Clear all content from a specific layer."""
         if layer in self.active_content:
-            content = self.active_content[layer]
-            if content and fade_out:
-                self.scene.play(
-                    *[FadeOut(obj) for obj in content],
-                    run_time=0.5
-                )
+            if fade_out:
+                self._fade_out(self.active_content[layer], run_time=0.5)
             self.active_content[layer] = []
     
     def clear_all(self, fade_out: bool = True, exclude_layers: List[TextLayer] = None):
-        """Clear all content from all layers."""
+        """Clear all content from all layers in a single fade."""
         exclude_layers = exclude_layers or []
-        for layer in TextLayer:
-            if layer not in exclude_layers:
-                self.clear_layer(layer, fade_out)
+        layers = [layer for layer in TextLayer if layer not in exclude_layers]
+        
+        if fade_out:
+            self._fade_out(
+                [obj for layer in layers for obj in self.active_content.get(layer, [])],
+                run_time=0.5
+            )
+        for layer in layers:
+            if layer in self.active_content:
+                self.active_content[layer] = []
     
     def transition_to_new_section(
         self,
@@ -190,11 +188,7 @@ class SceneManager:
             if layer in self.active_content:
                 fade_outs.extend(self.active_content[layer])
         
-        if fade_outs:
-            self.scene.play(
-                *[FadeOut(obj) for obj in fade_outs],
-                run_time=fade_time
-            )
+        self._fade_out(fade_outs, run_time=fade_time)
         
         # Clear from tracking
         for layer in layers_to_clear:
@@ -210,6 +204,16 @@ class SceneManager:
                 position='top'
             )
     
+    def _fade_out(self, mobjects: List[Mobject], run_time: float):
+        """
+        Fade out tracked content as one animation.
+        
+        Layers already keep their mobjects in lists, so no scene scan is
+        needed; grouping them means one FadeOut instead of one per object.
+        """
+        if mobjects:
+            self.scene.play(FadeOut(Group(*mobjects)), run_time=run_time)
+    
     def _position_text(self, text_obj: Mobject, layer: TextLayer, position: str, buff: float):
         """Position text using a position hint."""
         if position == 'top':
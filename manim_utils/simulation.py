@@ -0,0 +1,142 @@
+"""
+Simulation Helpers
+
+Shared pieces for scenes that animate a precomputed random simulation:
+the seed every scene's Generator is built from, a fixed-step clock that
+plays the simulation steps during a single wait, and the per-step callback
+for the water-and-pollen Brownian motion sections.
+"""
+
+from typing import Callable, Sequence, Tuple
+
+import numpy as np
+from manim import GREEN, ORANGE, PURPLE, RED, YELLOW, Mobject, Scene, VGroup, VMobject
+
+from manim_utils.vectorized import brownian_step, corner_bezier_points
+
+# Seed for every scene's random Generator. Fixed so renders are reproducible
+# and manim's partial movie cache can be reused between runs
+RANDOM_SEED = 0
+
+
+def wait_fixed_steps(
+    scene: Scene,
+    mobject: Mobject,
+    advance: Callable[[int], None],
+    step_time: float,
+    num_steps: int
+) -> None:
+    """
+    Play num_steps simulation steps on a fixed step_time clock in one wait.
+    
+    An updater on mobject calls advance(k) for k = 0, 1, ... as the frame
+    clock passes each step boundary. The frame dts sum to one frame short of
+    the wait (manim's first frame has dt=0), so any steps the clock did not
+    reach are applied after the wait and the final state is always the last
+    step.
+    
+    Args:
+        scene: Scene to wait on
+        mobject: Mobject in the scene that carries the updater
+        advance: Callback applying step k
+        step_time: Simulated seconds per step
+        num_steps: Number of steps to play
+    """
+    elapsed, steps_taken = 0.0, 0
+    
+    def tick(mob, dt):
+        nonlocal elapsed, steps_taken
+        elapsed += dt
+        while elapsed >= step_time - 1e-9 and steps_taken < num_steps:
+            elapsed -= step_time
+            advance(steps_taken)
+            steps_taken += 1
+    
+    mobject.add_updater(tick)
+    scene.wait(step_time * num_steps)
+    mobject.remove_updater(tick)
+    
+    while steps_taken < num_steps:
+        advance(steps_taken)
+        steps_taken += 1
+
+
+def brownian_particle_stepper(
+    water_molecules: VGroup,
+    water_pos: np.ndarray,
+    water_steps: np.ndarray,
+    water_bounds: Tuple[np.ndarray, np.ndarray],
+    pollen_grains: VGroup,
+    pollen_pos: np.ndarray,
+    pollen_steps: np.ndarray,
+    pollen_bounds: Tuple[np.ndarray, np.ndarray],
+    trail_colors: Sequence = (RED, GREEN, YELLOW, PURPLE, ORANGE)
+) -> Tuple[Callable[[int], None], VGroup]:
+    """
+    Build the callback that moves water molecules and pollen grains a step.
+    
+    Positions are (N, 2) arrays updated in place, so each step moves all
+    particles of a kind with one brownian_step call. Pollen positions are
+    recorded per step and written straight into one polyline per grain.
+    
+    Args:
+        water_molecules: One mobject per row of water_pos
+        water_pos: (N, 2) molecule positions, updated in place
+        water_steps: (num_steps, N, 2) pre-drawn molecule displacements
+        water_bounds: (lo, hi) corners the molecules reflect off
+        pollen_grains: One mobject per row of pollen_pos
+        pollen_pos: (M, 2) grain positions, updated in place
+        pollen_steps: (num_steps, M, 2) pre-drawn grain displacements
+        pollen_bounds: (lo, hi) corners the grains reflect off
+        trail_colors: Stroke colors cycled over the grain trajectories
+    
+    Returns:
+        (advance, pollen_trajectories): advance(k) applies step k and is
+        meant for wait_fixed_steps(); the trajectories are not yet added
+        to the scene
+    """
+    water_lo, water_hi = water_bounds
+    pollen_lo, pollen_hi = pollen_bounds
+    num_steps = len(pollen_steps)
+    
+    pollen_history = np.zeros((len(pollen_pos), num_steps + 1, 3))
+    pollen_history[:, 0, :2] = pollen_pos
+    pollen_trajectories = VGroup(*[
+        VMobject(
+            stroke_color=trail_colors[i % len(trail_colors)],
+            stroke_width=3,
+            stroke_opacity=0.7
+        )
+        for i in range(len(pollen_pos))
+    ])
+    
+    # Bound shift methods are looked up once, so the per-step loops only
+    # make local calls. Each step writes the displacement into a
+    # preallocated (N, 3) buffer and shifts by its rows, which avoids both
+    # per-particle point lists and move_to's bounding-box pass
+    shift_molecules = [mol.shift for mol in water_molecules]
+    shift_pollen = [pollen.shift for pollen in pollen_grains]
+    water_delta = np.zeros((len(water_pos), 3))
+    pollen_delta = np.zeros((len(pollen_pos), 3))
+    
+    def advance(step):
+        water_delta[:, :2] = water_pos
+        brownian_step(water_pos, water_steps[step], water_lo, water_hi)
+        np.subtract(water_pos, water_delta[:, :2], out=water_delta[:, :2])
+        for shift, delta in zip(shift_molecules, water_delta):
+            shift(delta)
+        
+        brownian_step(pollen_pos, pollen_steps[step], pollen_lo, pollen_hi)
+        pollen_history[:, step + 1, :2] = pollen_pos
+        np.subtract(
+            pollen_history[:, step + 1],
+            pollen_history[:, step],
+            out=pollen_delta
+        )
+        for shift, delta, trail, history in zip(
+            shift_pollen, pollen_delta, pollen_trajectories, pollen_history
+        ):
+            shift(delta)
+            trail.points = corner_bezier_points(history[:step + 2])
+    
+    return advance, pollen_trajectories
@@ -0,0 +1,125 @@
+"""
+Vectorized Coordinate Utilities
+
+Helpers for converting whole arrays of axes coordinates to scene points.
+coords_to_point recomputes the axis origin and unit vectors on every call;
+these helpers compute the affine transform once and apply it with a single
+NumPy matmul. corner_bezier_points builds polyline bezier data for many
+paths at once, so VMobject points can be assigned directly.
+
+brownian_step and random_walk_positions are the particle kernels shared by
+the Brownian motion scenes; they are compiled with Numba when it is
+installed and run as plain NumPy otherwise.
+"""
+
+import numpy as np
+
+# Numba is optional; without it the kernels below run as plain NumPy
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def axes_affine(axes):
+    """
+    Return (origin, basis) such that axes.c2p(*c) == origin + basis @ c.
+
+    Works for Axes and ThreeDAxes with linear scaling. The pair is computed
+    once and cached on the axes instance, so position the axes before the
+    first call and do not move or scale them afterwards.
+
+    Args:
+        axes: Axes or ThreeDAxes instance
+
+    Returns:
+        Tuple of the origin point (3,) and the basis matrix (3, dim)
+    """
+    if not hasattr(axes, "_affine"):
+        dim = len(axes.get_axes())
+        origin = np.asarray(axes.c2p(*np.zeros(dim)), dtype=float)
+        basis = np.column_stack([
+            np.asarray(axes.c2p(*unit), dtype=float) - origin
+            for unit in np.eye(dim)
+        ])
+        axes._affine = (origin, basis)
+    return axes._affine
+
+
+def coords_to_points(axes, coords):
+    """
+    Convert an array of axes coordinates to scene points in one matmul.
+
+    Args:
+        axes: Axes or ThreeDAxes instance
+        coords: Array of shape (..., dim)
+
+    Returns:
+        Array of scene points with shape (..., 3)
+    """
+    origin, basis = axes_affine(axes)
+    return origin + np.asarray(coords, dtype=float) @ basis.T
+
+
+def corner_bezier_points(paths):
+    """
+    Expand polyline corners into the cubic bezier points that
+    VMobject.set_points_as_corners produces, for a whole batch of paths.
+
+    Assign a result row to vmobject.points directly; handles are placed
+    at 1/3 and 2/3 of each straight segment.
+
+    Args:
+        paths: Array of corner points with shape (..., N, 3)
+
+    Returns:
+        Array of bezier points with shape (..., 4 * (N - 1), 3)
+    """
+    start = paths[..., :-1, None, :]
+    delta = paths[..., 1:, None, :] - start
+    alphas = np.linspace(0, 1, 4)[:, None]
+    return (start + alphas * delta).reshape(*paths.shape[:-2], -1, 3)
+
+
+def brownian_step(positions, steps, lo, hi):
+    """
+    Add one random step to every position in place and clip the result
+    to the box [lo, hi]. positions and steps have shape (N, 2).
+    """
+    positions += steps
+    np.clip(positions, lo, hi, out=positions)
+
+
+def _brownian_step_parallel(positions, steps, lo, hi):
+    """Loop form of brownian_step, compiled with particles in parallel."""
+    for i in prange(positions.shape[0]):
+        for d in range(positions.shape[1]):
+            v = positions[i, d] + steps[i, d]
+            positions[i, d] = min(hi[d], max(lo[d], v))
+
+
+def random_walk_positions(steps):
+    """
+    Accumulate 1D random-walk steps into positions that start at 0.
+
+    steps has shape (num_steps,); the result has shape (num_steps + 1,).
+    """
+    positions = np.empty(steps.shape[0] + 1)
+    positions[0] = 0.0
+    np.cumsum(steps, out=positions[1:])
+    return positions
+
+
+def _random_walk_positions_loop(steps):
+    """Loop form of random_walk_positions, for Numba compilation."""
+    positions = np.empty(steps.shape[0] + 1)
+    positions[0] = 0.0
+    for i in range(steps.shape[0]):
+        positions[i + 1] = positions[i] + steps[i]
+    return positions
+
+
+if NUMBA_AVAILABLE:
+    brownian_step = njit(cache=True, parallel=True)(_brownian_step_parallel)
+    random_walk_positions = njit(cache=True)(_random_walk_positions_loop)